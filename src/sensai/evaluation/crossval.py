@@ -202,6 +202,8 @@ class VectorModelCrossValidator(MetricsDictProvider, Generic[TCrossValData], ABC
                              f"{eval_data.get_eval_stats(predicted_var_name=predictedVarName)}")
                 eval_data_list.append(eval_data)
                 test_indices_list.append(evaluator.test_data.outputs.index)
+                if len(predicted_var_names) == 1:
+                    self._report_intermediate_metrics(i, lambda: eval_data.get_eval_stats().metrics_dict())
             crossval_data = self._create_result_data(trained_models, eval_data_list, test_indices_list, predicted_var_names)
             if tracking_context.is_enabled():
                 crossval_data.track_metrics(tracking_context)
@@ -14,7 +14,6 @@ import matplotlib.figure
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 
 from .crossval import VectorModelCrossValidationData, VectorRegressionModelCrossValidationData, \
     VectorClassificationModelCrossValidationData, \
@@ -114,6 +113,7 @@ def eval_model_via_evaluator(model: TModel, io_data: InputOutputData, test_fract
 
     :return: the evaluation data
     """
+    import seaborn as sns
     if plot_target_distribution:
         title = "Distribution of target values in entire dataset"
         fig = plt.figure(title)
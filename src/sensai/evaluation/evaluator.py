@@ -28,6 +28,29 @@ TEvalStatsCollection = TypeVar("TEvalStatsCollection", bound=EvalStatsCollection
 
 
 class MetricsDictProvider(TrackingMixin, ABC):
+    _intermediate_metrics_callback: Optional[Callable[[int, Dict[str, float]], None]] = None
+
+    def set_intermediate_metrics_callback(self, callback: Optional[Callable[[int, Dict[str, float]], None]]):
+        """
+        Sets a callback which is informed about intermediate metrics that are determined during the computation of metrics
+        (e.g. the metrics of individual folds in cross-validation), provided that the implementation supports this.
+        The callback may raise an exception in order to abort the computation (e.g. for pruning in hyperparameter optimisation).
+
+        :param callback: a function which is called with the (1-based) step number and the dictionary of metrics for the step;
+            None to remove a previously set callback
+        """
+        self._intermediate_metrics_callback = callback
+
+    def _report_intermediate_metrics(self, step: int, metrics_dict_fn: Callable[[], Dict[str, float]]):
+        """
+        Reports intermediate metrics to the callback (if any)
+
+        :param step: the (1-based) step number
+        :param metrics_dict_fn: a function which computes the metrics dictionary for the step (called only if a callback is set)
+        """
+        if self._intermediate_metrics_callback is not None:
+            self._intermediate_metrics_callback(step, metrics_dict_fn())
+
     @abstractmethod
     def _compute_metrics(self, model, **kwargs) -> Dict[str, float]:
         """
@@ -7,7 +7,6 @@ from typing import Dict, Union, Sequence, List, Tuple, Optional
 
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from matplotlib import pyplot as plt
 
 from .data import InputOutputData
@@ -89,6 +88,7 @@ class FeatureImportanceProvider(ABC):
 
 
 def plot_feature_importance(feature_importance_dict: Dict[str, float], subtitle: str = None, sort=True) -> plt.Figure:
+    import seaborn as sns
     if sort:
         feature_importance_dict = {k: v for k, v in sorted(feature_importance_dict.items(), key=lambda x: x[1], reverse=True)}
     num_features = len(feature_importance_dict)
@@ -1,21 +1,33 @@
+import csv
+import functools
+import importlib.util
 import itertools
 import logging
+import math
+import numbers
 import os
 from abc import ABC
 from abc import abstractmethod
-from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime
 from random import Random
-from typing import Dict, Sequence, Any, Callable, Generator, Union, Tuple, List, Optional, Hashable, Iterator, TypeVar, Iterable, Generic
+from typing import Dict, Sequence, Any, Callable, Generator, Union, Tuple, List, Optional, Hashable, Iterator, TypeVar, Iterable, Generic, \
+    TextIO, Set
 
+import numpy as np
 import pandas as pd
 
 from .evaluation.evaluator import MetricsDictProvider
 from .local_search import SACostValue, SACostValueNumeric, SAOperator, SAState, SimulatedAnnealing, \
     SAProbabilitySchedule, SAProbabilityFunctionLinear
-from .tracking.tracking_base import TrackingMixin, TrackedExperiment
+from .tracking.tracking_base import TrackingMixin, BackgroundValuesTracker
+from .util.cache import KeyValueCache
+from .util.hash import pickle_hash
 from .util.string import ToStringMixin
+from .util.version import Version
 from .vector_model import VectorModel
 
 log = logging.getLogger(__name__)
@@ -29,31 +41,19 @@ def iter_param_combinations(hyper_param_values: Dict[str, Sequence[Any]]) -> Gen
     :param hyper_param_values: a mapping from parameter names to lists of possible values
     :return: a dictionary mapping each parameter name to one of the values
     """
-    pairs = list(hyper_param_values.items())
-
-    def _iter_recursive_param_combinations(pairs, i, params):
-        """
-        Recursive function to create all possible combinations from a list of key-array entries.
-        :param pairs: a dictionary of parameter names and their corresponding values
-        :param i: the recursive step
-        :param params: a dictionary for the iteration results
-        """
-        if i == len(pairs):
-            yield dict(params)
-        else:
-            param_name, param_values = pairs[i]
-            for paramValue in param_values:
-                params[param_name] = paramValue
-                yield from _iter_recursive_param_combinations(pairs, i+1, params)
-
-    return _iter_recursive_param_combinations(pairs, 0, {})
+    param_names = list(hyper_param_values.keys())
+    for values in itertools.product(*hyper_param_values.values()):
+        yield dict(zip(param_names, values))
 
 
 def iter_subsets(s: Iterable[T]) -> Iterator[Sequence[T]]:
     """
     :param s: a set of items
-    :return: iterator over subsets of the given set
+    :return: iterator over subsets of the given set, which are yielded as tuples in order of increasing size (and, for each
+        size, in lexicographic order of the items' positions in `s`)
     """
+    # NOTE: itertools.combinations enumerates the subsets of each size at C level; enumerating bit masks in Python instead
+    # is considerably slower and would not preserve the order of the subsets
     s = list(s)
     return itertools.chain.from_iterable(itertools.combinations(s, r) for r in range(len(s) + 1))
 
@@ -85,6 +85,127 @@ class ParameterCombinationSkipDecider(ABC):
         pass
 
 
+class TrialPruned(Exception):
+    """
+    Exception which is raised in order to abort the evaluation of a parameter combination (trial) that was pruned
+    """
+    def __init__(self, trial_id: Hashable, step: int, value: float):
+        """
+        :param trial_id: the identifier of the trial
+        :param step: the step at which the trial was pruned
+        :param value: the (aggregated) intermediate metric value based on which the trial was pruned
+        """
+        super().__init__(f"Trial {trial_id} pruned at step {step} (intermediate value: {value})")
+        self.trial_id = trial_id
+        self.step = step
+        self.value = value
+
+
+class Pruner(ABC):
+    """
+    Abstraction for a functional component which is informed about intermediate metric values of trials (evaluations of parameter
+    combinations), e.g. the metrics of individual folds in cross-validation, and which decides whether a trial shall be aborted
+    early (pruned) because it is unlikely to yield a competitive result.
+    Intermediate metrics are reported by metrics providers which support it (see
+    :meth:`sensai.evaluation.evaluator.MetricsDictProvider.set_intermediate_metrics_callback`), e.g. cross-validators.
+    """
+    def __init__(self, metric_name: str, higher_is_better: bool):
+        """
+        :param metric_name: the name of the metric in the dictionaries of intermediate metrics (e.g. the name of the
+            metric for a single fold in cross-validation)
+        :param higher_is_better: whether higher values of the metric are better
+        """
+        self.metric_name = metric_name
+        self.higher_is_better = higher_is_better
+
+    @abstractmethod
+    def report(self, trial_id: Hashable, step: int, value: float):
+        """
+        Informs the pruner about an intermediate value of a trial
+
+        :param trial_id: the identifier of the trial
+        :param step: the (1-based) step number
+        :param value: the intermediate metric value
+        """
+        pass
+
+    @abstractmethod
+    def should_prune(self, trial_id: Hashable) -> bool:
+        """
+        :param trial_id: the identifier of the trial
+        :return: True iff the trial shall be pruned given the values that have been reported for it so far
+        """
+        pass
+
+    @abstractmethod
+    def _get_current_value(self, trial_id: Hashable) -> float:
+        """
+        :param trial_id: the identifier of the trial
+        :return: the (aggregated) intermediate value of the trial on which the pruning decision is based
+        """
+        pass
+
+    @contextmanager
+    def trial(self, metrics_evaluator: MetricsDictProvider, trial_id: Hashable):
+        """
+        Context manager within which the intermediate metrics reported by the given metrics provider are passed on to this pruner,
+        raising :class:`TrialPruned` if the trial shall be pruned
+
+        :param metrics_evaluator: the metrics provider with which the trial is evaluated
+        :param trial_id: the identifier of the trial
+        """
+        def callback(step: int, metrics: Dict[str, float]):
+            self.report(trial_id, step, metrics[self.metric_name])
+            if self.should_prune(trial_id):
+                raise TrialPruned(trial_id, step, self._get_current_value(trial_id))
+
+        metrics_evaluator.set_intermediate_metrics_callback(callback)
+        try:
+            yield
+        finally:
+            metrics_evaluator.set_intermediate_metrics_callback(None)
+
+
+class MedianPruner(Pruner):
+    """
+    Prunes a trial if the mean of its intermediate values (up to the current step) is worse than the median of the corresponding
+    means of the previous trials at the same step
+    """
+    def __init__(self, metric_name: str, higher_is_better: bool, min_trials: int = 5, min_steps: int = 1):
+        """
+        :param metric_name: the name of the metric in the dictionaries of intermediate metrics
+        :param higher_is_better: whether higher values of the metric are better
+        :param min_trials: the minimum number of previous trials that must have reported a value for a step in order for
+            pruning to be applied at that step
+        :param min_steps: the minimum step number at which pruning can be applied
+        """
+        super().__init__(metric_name, higher_is_better)
+        self.min_trials = min_trials
+        self.min_steps = min_steps
+        self._trial_values: Dict[Hashable, List[float]] = defaultdict(list)
+        self._step_means: Dict[int, List[float]] = defaultdict(list)
+        self._prune_decisions: Dict[Hashable, bool] = {}
+
+    def report(self, trial_id: Hashable, step: int, value: float):
+        values = self._trial_values[trial_id]
+        values.append(value)
+        mean_value = self._get_current_value(trial_id)
+        previous_means = self._step_means[step]
+        prune = False
+        if step >= self.min_steps and len(previous_means) >= self.min_trials:
+            median = np.median(previous_means)
+            prune = mean_value < median if self.higher_is_better else mean_value > median
+        self._prune_decisions[trial_id] = prune
+        previous_means.append(mean_value)
+
+    def should_prune(self, trial_id: Hashable) -> bool:
+        return self._prune_decisions.get(trial_id, False)
+
+    def _get_current_value(self, trial_id: Hashable) -> float:
+        values = self._trial_values[trial_id]
+        return sum(values) / len(values)
+
+
 class ParameterCombinationEquivalenceClassValueCache(ABC):
     """
     Represents a cache which stores (arbitrary) values for parameter combinations, i.e. keys in the cache
@@ -93,42 +214,75 @@ class ParameterCombinationEquivalenceClassValueCache(ABC):
     parameter combinations are equivalent; the keys thus correspond to representations of equivalence classes over
     parameter combinations.
     This enables hyper-parameter search to skip the re-computation of results for equivalent parameter combinations.
+    By default, all parameters are considered relevant, i.e. only identical parameter combinations are equivalent;
+    subclasses can override :meth:`_equivalence_class` to define a coarser notion of equivalence.
+
+    Values are stored in memory and can, optionally, additionally be stored in a persistent cache (e.g. an
+    instance of :class:`sensai.util.cache.SqlitePersistentKeyValueCache`), such that results can be reused across
+    runs/processes.
     """
-    def __init__(self):
+    def __init__(self, persistent_cache: Optional[KeyValueCache[str, Any]] = None):
+        """
+        :param persistent_cache: an optional (persistent) cache in which to additionally store values, using a deterministic
+            hash of the equivalence class representation (as computed by :func:`sensai.util.hash.pickle_hash`) as the key
+        """
         self._cache = {}
+        self._persistent_cache = persistent_cache
 
-    @abstractmethod
     def _equivalence_class(self, params: Dict[str, Any]) -> Hashable:
         """
         Computes a (hashable) equivalence class representation for the given parameter combination.
-        For instance, if all parameters have influence on the evaluation of a model and no two combinations would 
-        lead to equivalent results, this could simply return a tuple containing all parameter values (in a fixed order).
+        The default implementation assumes that all parameters have influence on the evaluation of a model and that no two
+        combinations would lead to equivalent results, returning the canonical tuple of (sorted) parameter items.
+        The parameter values must thus be hashable.
 
         :param params: the parameter combination
         :return: a hashable key containing all the information from the parameter combination that influences the
             computation of model evaluation results
         """
-        pass
+        return tuple(sorted(params.items()))
 
     def set(self, params: Dict[str, Any], value: Any):
-        self._cache[self._equivalence_class(params)] = value
+        key = self._equivalence_class(params)
+        self._cache[key] = value
+        if self._persistent_cache is not None:
+            self._persistent_cache.set(pickle_hash(key), value)
 
     def get(self, params: Dict[str, Any]):
         """
         Gets the value associated with the (equivalence class of the) parameter combination
         :param params: the parameter combination
-        :return:
+        :return: the value or None if no value is stored for the parameter combination
         """
-        return self._cache.get(self._equivalence_class(params))
+        key = self._equivalence_class(params)
+        value = self._cache.get(key)
+        if value is None and self._persistent_cache is not None:
+            value = self._persistent_cache.get(pickle_hash(key))
+            if value is not None:
+                self._cache[key] = value
+        return value
 
 
 class ParametersMetricsCollection:
     """
-    Utility class for holding and persisting evaluation results
+    Utility class for holding and persisting evaluation results.
+
+    Results are stored in columnar form (one list of values per column); the data frame representation is created upon request.
+    When a CSV path is given, rows are appended to the CSV file upon every update (the file being rewritten only if new
+    columns are encountered), i.e. the rows in the CSV file appear in the order in which they were added.
+    The CSV file is kept open while rows are being added; use :meth:`close` (or use the instance as a context manager)
+    in order to close it.
+    """
+    CSV_BUFFER_SIZE = 1 << 16
+    CSV_FSYNC_INTERVAL = 10
+    """
+    the number of appended rows after which the CSV file is synchronised with the storage device (rows are always flushed
+    to the operating system immediately)
     """
+
     def __init__(self, csv_path=None, sort_column_name=None, ascending=True, incremental=False):
         """
-        :param csv_path: path to save the data frame to upon every update
+        :param csv_path: path to save the data to upon every update
         :param sort_column_name: the column name by which to sort the data frame that is collected; if None, do not sort
         :param ascending: whether to sort in ascending order; has an effect only if sortColumnName is not None
         :param incremental: whether to add to an existing CSV file instead of overwriting it
@@ -138,19 +292,110 @@ class ParametersMetricsCollection:
         self.ascending = ascending
         csv_path_exists = csv_path is not None and os.path.exists(csv_path)
         if csv_path_exists and incremental:
-            self.df = pd.read_csv(csv_path)
-            log.info(f"Found existing CSV file with {len(self.df)} entries; {csv_path} will be extended (incremental mode)")
-            self._current_row = len(self.df)
-            self.value_dicts = [nt._asdict() for nt in self.df.itertuples()]
+            df = self._read_csv(csv_path)
+            log.info(f"Found existing CSV file with {len(df)} entries; {csv_path} will be extended (incremental mode)")
+            self._cols: Optional[Dict[str, List[Any]]] = {c: df[c].tolist() for c in df.columns}
+            self._num_rows = len(df)
+            self._csv_columns: Optional[List[str]] = list(df.columns)
         else:
             if csv_path is not None:
                 if not csv_path_exists:
                     log.info(f"Results will be written to new file {csv_path}")
                 else:
                     log.warning(f"Results in existing file ({csv_path}) will be overwritten (non-incremental mode)")
-            self.df = None
-            self._current_row = 0
-            self.value_dicts = []
+            self._cols = None
+            self._num_rows = 0
+            self._csv_columns = None
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer = None
+        self._num_unsynced_csv_rows = 0
+        self._value_indices: Dict[str, Dict[Tuple[str, str], Set[int]]] = {}
+        """
+        mapping from a key name to an index which maps each form of the values in the respective column (see `_compute_value_forms`)
+        to the set of indices of the rows containing a matching value; indices are created lazily upon the first query for a key
+        """
+
+    @staticmethod
+    def _is_pyarrow_csv_engine_available() -> bool:
+        """
+        :return: whether pandas' pyarrow engine for reading CSV files (added in pandas 1.4) can be used
+        """
+        return Version(pd).is_at_least(1, 4) and importlib.util.find_spec("pyarrow") is not None
+
+    @classmethod
+    def _read_csv(cls, csv_path: str) -> pd.DataFrame:
+        """
+        Reads a CSV file with existing results, using pandas' (multi-threaded) pyarrow engine if it is available
+
+        :param csv_path: the path of the CSV file
+        :return: the data frame
+        """
+        if cls._is_pyarrow_csv_engine_available():
+            try:
+                return pd.read_csv(csv_path, engine="pyarrow")
+            except (ImportError, ValueError) as e:
+                log.warning(f"Could not read {csv_path} using the pyarrow engine ({e}); falling back to the default engine")
+        return pd.read_csv(csv_path)
+
+    @property
+    def value_dicts(self) -> List[Dict[str, Any]]:
+        """
+        :return: the list of rows as dictionaries (created upon request)
+        """
+        if self._cols is None:
+            return []
+        columns = list(self._cols.keys())
+        return [dict(zip(columns, row)) for row in zip(*self._cols.values())]
+
+    @staticmethod
+    def _compute_value_forms(v) -> Tuple[Tuple[str, Any], ...]:
+        """
+        :param v: a value
+        :return: the forms under which the value is indexed, where two values are considered to match (as in the case of values
+            read from CSV files) if they are equal or have the same string representation, i.e. if they share a form:
+            every value has its string representation as a form, numbers additionally have a representation of their
+            numeric value (which is the same for equal numbers of different types, e.g. 1 and 1.0) and other hashable values
+            (apart from strings and None) additionally have the value itself as a form (e.g. for (1, 2) and (1.0, 2.0));
+            unhashable values are matched via their string representations only
+        """
+        forms = (("s", str(v)),)
+        if isinstance(v, numbers.Number):
+            try:
+                numeric_repr = str(int(v)) if v == int(v) else repr(float(v))
+            except (ValueError, OverflowError, TypeError):
+                numeric_repr = str(v)
+            forms += (("n", numeric_repr),)
+        elif v is not None and not isinstance(v, str):
+            try:
+                hash(v)
+                forms += (("v", v),)
+            except TypeError:
+                pass
+        return forms
+
+    @classmethod
+    def _value_forms(cls, v) -> Tuple[Tuple[str, Any], ...]:
+        """
+        :param v: a value
+        :return: the forms of the value (see `_compute_value_forms`), which are cached for strings and numbers, as the same
+            (parameter) values typically occur many times; other values are not cached, because equal values (sharing a
+            cache entry) may have different string representations, e.g. (1, 2) and (1.0, 2.0)
+        """
+        if v is None or isinstance(v, (str, numbers.Number)):
+            return _cached_value_forms(v)
+        else:
+            return cls._compute_value_forms(v)
+
+    def _get_value_index(self, key: str) -> Dict[Tuple[str, str], Set[int]]:
+        index = self._value_indices.get(key)
+        if index is None:
+            index = {}
+            if self._cols is not None:
+                for row_idx, v in enumerate(self._cols.get(key, [None] * self._num_rows)):
+                    for form in self._value_forms(v):
+                        index.setdefault(form, set()).add(row_idx)
+            self._value_indices[key] = index
+        return index
 
     def add_values(self, values: Dict[str, Any]):
         """
@@ -160,7 +405,7 @@ class ParametersMetricsCollection:
         :param values: Dict holding the evaluation results and parameters
         :return:
         """
-        if self.df is None:
+        if self._cols is None:
             cols = list(values.keys())
 
             # check sort column and move it to the front
@@ -172,44 +417,120 @@ class ParametersMetricsCollection:
                     cols.remove(self.sort_column_name)
                     cols.insert(0, self.sort_column_name)
 
-            self.df = pd.DataFrame(columns=cols)
+            self._cols = {c: [] for c in cols}
         else:
             # check for new columns
             for col in values.keys():
-                if col not in self.df.columns:
-                    self.df[col] = None
+                if col not in self._cols:
+                    self._cols[col] = [None] * self._num_rows
 
-        # append data to data frame
-        self.df.loc[self._current_row] = [values.get(c) for c in self.df.columns]
-        self._current_row += 1
+        for col, col_values in self._cols.items():
+            col_values.append(values.get(col))
+        for key, index in self._value_indices.items():
+            for form in self._value_forms(values.get(key)):
+                index.setdefault(form, set()).add(self._num_rows)
+        self._num_rows += 1
 
-        # sort where applicable
-        if self.sort_column_name is not None and self.sort_column_name in self.df.columns:
-            self.df.sort_values(self.sort_column_name, axis=0, inplace=True, ascending=self.ascending)
-            self.df.reset_index(drop=True, inplace=True)
+        self._save_csv(values)
 
-        self._save_csv()
+    def _save_csv(self, values: Dict[str, Any]):
+        """
+        Saves the given new row to the CSV file (if any), appending it if possible and rewriting the entire file otherwise
 
-    def _save_csv(self):
-        if self.csv_path is not None:
+        :param values: the values of the row that was added
+        """
+        if self.csv_path is None:
+            return
+        if self._csv_columns is not None and len(self._csv_columns) == len(self._cols):
+            if self._csv_file is None:
+                self._csv_file = open(self.csv_path, "a", buffering=self.CSV_BUFFER_SIZE, newline="")
+                self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow([values.get(c) for c in self._csv_columns])
+            self._csv_file.flush()
+            self._num_unsynced_csv_rows += 1
+            if self._num_unsynced_csv_rows >= self.CSV_FSYNC_INTERVAL:
+                self._sync_csv()
+        else:
+            self.close()
             dirname = os.path.dirname(self.csv_path)
             if dirname != "":
                 os.makedirs(dirname, exist_ok=True)
-            self.df.to_csv(self.csv_path, index=False)
+            self._csv_columns = list(self._cols.keys())
+            with open(self.csv_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(self._csv_columns)
+                writer.writerows(zip(*self._cols.values()))
 
-    def get_data_frame(self) -> pd.DataFrame:
-        return self.df
+    def _sync_csv(self):
+        os.fsync(self._csv_file.fileno())
+        self._num_unsynced_csv_rows = 0
 
-    def contains(self, values: Dict[str, Any]):
-        for existingValues in self.value_dicts:
-            is_contained = True
-            for k, v in values.items():
-                ev = existingValues.get(k)
-                if ev != v and str(ev) != str(v):
-                    is_contained = False
-                    break
-            if is_contained:
-                return True
+    def close(self):
+        """
+        Closes the CSV file (if it is open), making sure that all data is written to disk.
+        The file will be reopened if further values are added.
+        """
+        if self._csv_file is not None:
+            self._csv_file.flush()
+            self._sync_csv()
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "_csv_file", None) is not None:
+            self.close()
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        return self.get_data_frame()
+
+    def get_data_frame(self) -> Optional[pd.DataFrame]:
+        """
+        :return: the data frame containing all the rows that were added (sorted, if a sort column was specified),
+            or None if the collection is empty and no existing data was loaded
+        """
+        if self._cols is None:
+            return None
+        df = pd.DataFrame(self._cols)
+        if self.sort_column_name is not None and self.sort_column_name in df.columns:
+            df.sort_values(self.sort_column_name, axis=0, inplace=True, ascending=self.ascending)
+            df.reset_index(drop=True, inplace=True)
+        return df
+
+    def __len__(self):
+        return self._num_rows
+
+    def contains(self, values: Dict[str, Any]) -> bool:
+        """
+        :param values: a dictionary of values (e.g. a parameter combination)
+        :return: True if the collection contains an entry whose values for the given keys are equal to the given values
+        """
+        if self._num_rows == 0:
+            return False
+        # determine, for each key, the set of rows with a matching value and intersect these sets (smallest first)
+        row_sets = []
+        for key, v in values.items():
+            index = self._get_value_index(key)
+            matching_row_sets = [index[form] for form in self._value_forms(v) if form in index]
+            if len(matching_row_sets) == 0:
+                return False
+            row_sets.append(matching_row_sets[0] if len(matching_row_sets) == 1 else set().union(*matching_row_sets))
+        if len(row_sets) == 0:
+            return True
+        row_sets.sort(key=len)
+        return len(row_sets[0].intersection(*row_sets[1:])) > 0
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _cached_value_forms(v) -> Tuple[Tuple[str, Any], ...]:
+    return ParametersMetricsCollection._compute_value_forms(v)
 
 
 class GridSearch(TrackingMixin):
@@ -219,6 +540,12 @@ class GridSearch(TrackingMixin):
     """
     log = log.getChild(__qualname__)
 
+    LOG_RESULTS_INTERVAL = 10
+    """
+    the number of collected results after which the (sorted) data frame of all results is logged during the search
+    (the final results always being logged)
+    """
+
     def __init__(self,
             model_factory: Callable[..., VectorModel],
             parameter_options: Union[Dict[str, Sequence[Any]], List[Dict[str, Sequence[Any]]]],
@@ -228,13 +555,19 @@ class GridSearch(TrackingMixin):
             incremental_skip_existing=False,
             parameter_combination_skip_decider: ParameterCombinationSkipDecider = None,
             model_save_directory: str = None,
-            name: str = None):
+            name: str = None,
+            parameter_combination_equivalence_class_value_cache: ParameterCombinationEquivalenceClassValueCache = None,
+            pruner: Optional[Pruner] = None,
+            executor: Optional[Executor] = None,
+            record_model_repr: bool = False):
         """
         :param model_factory: the function to call with keyword arguments reflecting the parameters to try in order to obtain a model
             instance
         :param parameter_options: a dictionary which maps from parameter names to lists of possible values - or a list of such dictionaries,
             where each dictionary in the list has the same keys
-        :param num_processes: the number of parallel processes to use for the search (use 1 to run without multi-processing)
+        :param num_processes: the number of parallel processes to use for the search (use 1 to run without multi-processing).
+            The process pool is created upon first use and is reused across runs; call :meth:`close` (or use the instance as a
+            context manager) in order to shut it down.
         :param csv_results_path: the path to a directory or concrete CSV file to which the results shall be written;
             if it is None, no CSV data will be written; if it is a directory, a file name starting with this grid search's name (see below)
             will be created.
@@ -243,10 +576,27 @@ class GridSearch(TrackingMixin):
         :param incremental_skip_existing: if incremental mode is on, whether to skip any parameter combinations that are already present
             in the CSV file
         :param parameter_combination_skip_decider: an instance to which parameters combinations can be passed in order to decide whether the
-            combination shall be skipped (e.g. because it is redundant/equivalent to another combination or inadmissible)
+            combination shall be skipped (e.g. because it is redundant/equivalent to another combination or inadmissible).
+            The decider is always queried and informed in the main process, i.e. it does not need to be picklable.
+            NOTE: In parallel mode, all combinations are queried prior to their submission to the executor/worker processes,
+            whereas the decider is informed of results only as they become available; skipping decisions therefore reflect only
+            the results that were known prior to submission (e.g. from previous runs), not the results of the current run.
         :param model_save_directory: the directory where the serialized models shall be saved; if None, models are not saved
         :param name: the name of this grid search, which will, in particular, be prepended to all saved model files;
             if None, a default name will be generated of the form "gridSearch_<timestamp>"
+        :param parameter_combination_equivalence_class_value_cache: a cache in which to store the computed results (values dictionaries)
+            and whose notion of equivalence can be used to avoid duplicate computations; use a cache with a persistent backend
+            to reuse results across runs
+        :param pruner: a pruner with which to abort the evaluation of unpromising parameter combinations early, based on the
+            intermediate metrics reported by the metrics evaluator (e.g. the metrics of individual folds in cross-validation);
+            pruned combinations are not included in the results. Pruning is supported only without multi-processing
+            (num_processes=1), as the pruner must observe all trials.
+        :param executor: an executor with which to evaluate parameter combinations in parallel, which overrides `num_processes`.
+            Any implementation of `concurrent.futures.Executor` can be used, e.g. the executor of a Dask cluster (as obtained via
+            `dask.distributed.Client.get_executor`) in order to distribute the search across several machines.
+            The executor is owned by the caller and is not shut down by the search.
+        :param record_model_repr: whether to add the string representation of each model to the results (column "str(model)");
+            as computing the representation can be costly for complex models, this is disabled by default
         """
         self.model_factory = model_factory
         if type(parameter_options) == list:
@@ -257,8 +607,14 @@ class GridSearch(TrackingMixin):
         for d in self.parameter_options_list[1:]:
             if set(d.keys()) != self.param_names:
                 raise ValueError("Keys must be the same for all parameter options dictionaries")
+        if pruner is not None and (num_processes != 1 or executor is not None):
+            raise ValueError("Pruning is not supported with parallel execution (num_processes > 1 or executor given)")
         self.num_processes = num_processes
+        self.executor = executor
+        self.record_model_repr = record_model_repr
+        self.pruner = pruner
         self.parameter_combination_skip_decider = parameter_combination_skip_decider
+        self.parameter_combination_equivalence_class_value_cache = parameter_combination_equivalence_class_value_cache
         self.model_save_directory = model_save_directory
         self.name = name if name is not None else "gridSearch_" + datetime.now().strftime('%Y%m%d-%H%M%S')
         self.csv_results_path = csv_results_path
@@ -281,28 +637,117 @@ class GridSearch(TrackingMixin):
     def _eval_params(cls,
             model_factory: Callable[..., VectorModel],
             metrics_evaluator: MetricsDictProvider,
-            skip_decider: ParameterCombinationSkipDecider,
+            pruner: Optional[Pruner],
             grid_search_name, combination_idx,
             model_save_directory: Optional[str],
+            record_model_repr: bool,
             **params) -> Optional[Dict[str, Any]]:
-        if skip_decider is not None:
-            if skip_decider.is_skipped(params):
-                cls.log.info(f"Parameter combination is skipped according to {skip_decider}: {params}")
-                return None
         cls.log.info(f"Evaluating {params}")
         model = model_factory(**params)
-        values = metrics_evaluator.compute_metrics(model)
+        try:
+            with pruner.trial(metrics_evaluator, combination_idx) if pruner is not None else nullcontext():
+                values = metrics_evaluator.compute_metrics(model)
+        except TrialPruned as e:
+            cls.log.info(f"Parameter combination was pruned ({e}): {params}")
+            return None
         if model_save_directory is not None:
             filename = f"{grid_search_name}_{combination_idx}.pickle"
             log.info(f"Saving trained model to {filename} ...")
             model.save(os.path.join(model_save_directory, filename))
             values["filename"] = filename
-        values["str(model)"] = str(model)
+        if record_model_repr:
+            values["str(model)"] = str(model)
         values.update(**params)
-        if skip_decider is not None:
-            skip_decider.tell(params, values)
         return values
 
+    def _is_skipped(self, params: Dict[str, Any]) -> bool:
+        """
+        :param params: the parameter combination
+        :return: whether the parameter combination shall be skipped according to the skip decider (if any)
+        """
+        skip_decider = self.parameter_combination_skip_decider
+        if skip_decider is not None and skip_decider.is_skipped(params):
+            self.log.info(f"Parameter combination is skipped according to {skip_decider}: {params}")
+            return True
+        return False
+
+    def _tell_skip_decider(self, params: Dict[str, Any], values: Optional[Dict[str, Any]]):
+        if self.parameter_combination_skip_decider is not None and values is not None:
+            self.parameter_combination_skip_decider.tell(params, values)
+
+    def _get_cached_values(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        :param params: the parameter combination
+        :return: a copy of the values that were previously computed for the (equivalence class of the) parameter combination,
+            or None if no values are available
+        """
+        if self.parameter_combination_equivalence_class_value_cache is None:
+            return None
+        values = self.parameter_combination_equivalence_class_value_cache.get(params)
+        if values is None:
+            return None
+        self.log.info(f"Result for parameter combination {params} could be retrieved from cache")
+        return dict(values)
+
+    def _set_cached_values(self, params: Dict[str, Any], values: Optional[Dict[str, Any]]):
+        if self.parameter_combination_equivalence_class_value_cache is not None and values is not None:
+            self.parameter_combination_equivalence_class_value_cache.set(params, dict(values))
+
+    def _is_parallel(self) -> bool:
+        return self.executor is not None or self.num_processes != 1
+
+    def _get_executor(self) -> Executor:
+        """
+        :return: the executor to use for parallel evaluations: the user-provided executor or a process pool, which is created
+            upon first use and reused for subsequent runs (until :meth:`close` is called)
+        """
+        if self.executor is not None:
+            return self.executor
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_processes)
+        return self._executor
+
+    def close(self):
+        """
+        Shuts down the process pool that was created for parallel evaluations (if any), terminating the worker processes.
+        A user-provided executor is not affected.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _iter_param_combinations(self) -> Iterator[Dict[str, Any]]:
+        """
+        :return: an iterator over all parameter combinations (for all parameter options dictionaries)
+        """
+        return itertools.chain.from_iterable(iter_param_combinations(o) for o in self.parameter_options_list)
+
+    def _create_values_tracker(self, metrics_evaluator: MetricsDictProvider) -> Optional[BackgroundValuesTracker]:
+        """
+        :return: a tracker which tracks result values in the background (for the tracked experiment of this object or, if it
+            is not set, the one of the metrics evaluator) or None if there is no tracked experiment
+        """
+        if self.tracked_experiment is not None:
+            return BackgroundValuesTracker(self.tracked_experiment)
+        elif metrics_evaluator.tracked_experiment is not None:
+            return BackgroundValuesTracker(metrics_evaluator.tracked_experiment)
+        else:
+            return None
+
+    def _log_intermediate_results(self, params_metrics_collection: ParametersMetricsCollection):
+        if len(params_metrics_collection) % self.LOG_RESULTS_INTERVAL == 0:
+            log.info(f"Updated search result:\n{params_metrics_collection.get_data_frame().to_string()}")
+
+    def _log_final_results(self, df: Optional[pd.DataFrame]):
+        if df is not None:
+            log.info(f"Final search result:\n{df.to_string()}")
+
     def run(self, metrics_evaluator: MetricsDictProvider, sort_column_name=None, ascending=True) -> "GridSearch.Result":
         """
         Run the grid search. If csvResultsPath was provided in the constructor, each evaluation result will be saved
@@ -316,52 +761,65 @@ class GridSearch(TrackingMixin):
             i.e. ascending=False means "higher is better", and ascending=True means "Lower is better".
         :return: an object holding the results
         """
-        if self.tracked_experiment is not None:
-            logging_callback = self.tracked_experiment.track_values
-        elif metrics_evaluator.tracked_experiment is not None:
-            logging_callback = metrics_evaluator.tracked_experiment.track_values
-        else:
-            logging_callback = None
+        values_tracker = self._create_values_tracker(metrics_evaluator)
         params_metrics_collection = ParametersMetricsCollection(csv_path=self.csv_results_path, sort_column_name=sort_column_name,
             ascending=ascending, incremental=self.incremental)
 
         def collect_result(values):
             if values is None:
                 return
-            if logging_callback is not None:
-                logging_callback(values)
+            if values_tracker is not None:
+                values_tracker.track_values(values)
             params_metrics_collection.add_values(values)
-            log.info(f"Updated grid search result:\n{params_metrics_collection.get_data_frame().to_string()}")
+            self._log_intermediate_results(params_metrics_collection)
 
-        if self.num_processes == 1:
+        if not self._is_parallel():
             combination_idx = 0
-            for parameter_options in self.parameter_options_list:
-                for params_dict in iter_param_combinations(parameter_options):
-                    if self.incremental_skip_existing and self.incremental:
-                        if params_metrics_collection.contains(params_dict):
-                            log.info(f"Skipped because parameters are already present in collection (incremental mode): {params_dict}")
-                            continue
-                    collect_result(self._eval_params(self.model_factory, metrics_evaluator, self.parameter_combination_skip_decider,
-                        self.name, combination_idx, self.model_save_directory, **params_dict))
-                    combination_idx += 1
+            for params_dict in self._iter_param_combinations():
+                if self.incremental_skip_existing and self.incremental:
+                    if params_metrics_collection.contains(params_dict):
+                        log.info(f"Skipped because parameters are already present in collection (incremental mode): {params_dict}")
+                        continue
+                values = self._get_cached_values(params_dict)
+                if values is None:
+                    if self._is_skipped(params_dict):
+                        combination_idx += 1
+                        continue
+                    values = self._eval_params(self.model_factory, metrics_evaluator, self.pruner, self.name, combination_idx,
+                        self.model_save_directory, self.record_model_repr, **params_dict)
+                    self._set_cached_values(params_dict, values)
+                    self._tell_skip_decider(params_dict, values)
+                collect_result(values)
+                combination_idx += 1
         else:
-            executor = ProcessPoolExecutor(max_workers=self.num_processes)
-            futures = []
+            executor = self._get_executor()
+            future_to_params = {}
             combination_idx = 0
-            for parameter_options in self.parameter_options_list:
-                for params_dict in iter_param_combinations(parameter_options):
-                    if self.incremental_skip_existing and self.incremental:
-                        if params_metrics_collection.contains(params_dict):
-                            log.info(f"Skipped because parameters are already present in collection (incremental mode): {params_dict}")
-                            continue
-                    futures.append(executor.submit(self._eval_params, self.model_factory, metrics_evaluator,
-                        self.parameter_combination_skip_decider,
-                        self.name, combination_idx, self.model_save_directory, **params_dict))
-                    combination_idx += 1
-            for future in futures:
-                collect_result(future.result())
-
+            for params_dict in self._iter_param_combinations():
+                if self.incremental_skip_existing and self.incremental:
+                    if params_metrics_collection.contains(params_dict):
+                        log.info(f"Skipped because parameters are already present in collection (incremental mode): {params_dict}")
+                        continue
+                values = self._get_cached_values(params_dict)
+                if values is not None:
+                    collect_result(values)
+                elif not self._is_skipped(params_dict):
+                    future = executor.submit(self._eval_params, self.model_factory, metrics_evaluator, self.pruner,
+                        self.name, combination_idx, self.model_save_directory, self.record_model_repr, **params_dict)
+                    future_to_params[future] = params_dict
+                combination_idx += 1
+            # collect results as soon as they become available (in order of completion)
+            for future in as_completed(future_to_params):
+                values = future.result()
+                self._set_cached_values(future_to_params[future], values)
+                self._tell_skip_decider(future_to_params[future], values)
+                collect_result(values)
+
+        params_metrics_collection.close()
+        if values_tracker is not None:
+            values_tracker.close()
         df = params_metrics_collection.get_data_frame()
+        self._log_final_results(df)
         return self.Result(df, self.param_names, default_metric_name=sort_column_name, default_higher_is_better=not ascending)
 
     class Result:
@@ -374,6 +832,7 @@ class GridSearch(TrackingMixin):
                 self.default_higher_is_better = default_higher_is_better
             else:
                 self.default_higher_is_better = None
+            self._best_params_cache: Dict[Tuple[str, bool], "GridSearch.Result.BestParams"] = {}
 
         @dataclass
         class BestParams:
@@ -400,18 +859,219 @@ class GridSearch(TrackingMixin):
                 if higher_is_better is None:
                     raise ValueError("higher_is_better must be specified")
 
-            df = self.df.sort_values(metric_name, axis=0, inplace=False, ascending=not higher_is_better)
+            cache_key = (metric_name, higher_is_better)
+            best = self._best_params_cache.get(cache_key)
+            if best is None:
+                metric_values = self.df[metric_name]
+                row = self.df.loc[metric_values.idxmax() if higher_is_better else metric_values.idxmin()]
+                best_params = {param: row[param] for param in self.param_names}
+                best = self.BestParams(metric_name=metric_name, metric_value=row[metric_name], params=best_params)
+                self._best_params_cache[cache_key] = best
+            return best
 
-            best_params = {}
-            for param in self.param_names:
-                best_params[param] = df.iloc[0][param]
-            best_metric_value = df.iloc[0][metric_name]
 
-            return self.BestParams(metric_name=metric_name, metric_value=best_metric_value, params=best_params)
+class SuccessiveHalvingSearch(GridSearch):
+    """
+    Grid search variant which applies successive halving (SHA) or, optionally, Hyperband to prune inferior parameter combinations early:
+    Parameter combinations are evaluated with an increasing budget (value of a resource parameter such as the number of epochs or
+    estimators that is passed on to the model factory), and after each round (rung), only the best 1/reduction_factor of the
+    combinations are retained for evaluation with the next larger budget (the budget being multiplied by reduction_factor).
+
+    With Hyperband enabled, several brackets of successive halving are run, which differ in the trade-off between the number of
+    combinations (randomly sampled from the grid) and the initial budget (see Li et al., 2018).
+    """
+    log = log.getChild(__qualname__)
+
+    def __init__(self,
+            model_factory: Callable[..., VectorModel],
+            parameter_options: Union[Dict[str, Sequence[Any]], List[Dict[str, Sequence[Any]]]],
+            budget_param_name: str,
+            min_resource: Union[int, float],
+            max_resource: Union[int, float],
+            reduction_factor: int = 3,
+            hyperband: bool = False,
+            num_processes=1,
+            csv_results_path: str = None,
+            parameter_combination_skip_decider: ParameterCombinationSkipDecider = None,
+            parameter_combination_equivalence_class_value_cache: ParameterCombinationEquivalenceClassValueCache = None,
+            model_save_directory: str = None,
+            name: str = None,
+            random_seed: int = 42,
+            pruner: Optional[Pruner] = None,
+            executor: Optional[Executor] = None,
+            record_model_repr: bool = False):
+        """
+        :param model_factory: the function to call with keyword arguments reflecting the parameters to try (including the budget
+            parameter) in order to obtain a model instance
+        :param parameter_options: a dictionary which maps from parameter names to lists of possible values - or a list of such dictionaries,
+            where each dictionary in the list has the same keys; the budget parameter must not be included
+        :param budget_param_name: the name of the keyword argument of the model factory via which the budget (resource) is passed
+        :param min_resource: the budget with which to evaluate parameter combinations in the first rung
+        :param max_resource: the maximum budget with which to evaluate parameter combinations
+        :param reduction_factor: the factor (eta) by which the number of parameter combinations is reduced and the budget is
+            increased from one rung to the next
+        :param hyperband: whether to apply Hyperband, i.e. to run several brackets of successive halving with different trade-offs
+            between the number of combinations and the initial budget; if False, apply successive halving to all combinations
+            of the grid, starting with `min_resource`
+        :param num_processes: the number of parallel processes to use for the evaluations within a rung (use 1 to run without
+            multi-processing)
+        :param csv_results_path: the path to a directory or concrete CSV file to which the results shall be written (see GridSearch);
+            the resulting CSV data will contain one line per evaluation, including the rung (and, for Hyperband, the bracket)
+        :param parameter_combination_skip_decider: an instance to which parameters combinations can be passed in order to decide whether the
+            combination shall be skipped
+        :param parameter_combination_equivalence_class_value_cache: a cache in which to store computed results (including the budget
+            parameter) and whose notion of equivalence can be used to avoid duplicate computations (e.g. across Hyperband brackets)
+        :param model_save_directory: the directory where the serialized models shall be saved; if None, models are not saved
+        :param name: the name of this search; if None, a default name will be generated
+        :param random_seed: the random seed with which to sample parameter combinations for Hyperband brackets
+        :param pruner: a pruner with which to abort the evaluation of unpromising parameter combinations early (see GridSearch);
+            note that trials are identified by their combination index, i.e. the pruner compares evaluations across all budgets
+        :param executor: an executor with which to evaluate parameter combinations in parallel, which overrides `num_processes`
+            (see GridSearch)
+        :param record_model_repr: whether to add the string representation of each model to the results (column "str(model)")
+        """
+        if reduction_factor < 2:
+            raise ValueError(f"reduction_factor must be at least 2, got {reduction_factor}")
+        if not (0 < min_resource <= max_resource):
+            raise ValueError(f"Invalid resource range: min_resource={min_resource}, max_resource={max_resource}")
+        super().__init__(model_factory, parameter_options, num_processes=num_processes, csv_results_path=csv_results_path,
+            parameter_combination_skip_decider=parameter_combination_skip_decider, model_save_directory=model_save_directory,
+            name=name if name is not None else "successiveHalving_" + datetime.now().strftime('%Y%m%d-%H%M%S'),
+            parameter_combination_equivalence_class_value_cache=parameter_combination_equivalence_class_value_cache, pruner=pruner,
+            executor=executor, record_model_repr=record_model_repr)
+        if budget_param_name in self.param_names:
+            raise ValueError(f"Budget parameter '{budget_param_name}' must not be included in the parameter options")
+        self.budget_param_name = budget_param_name
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.reduction_factor = reduction_factor
+        self.hyperband = hyperband
+        self.random_seed = random_seed
+
+    def _eval_params_list(self, metrics_evaluator: MetricsDictProvider, params_list: List[Dict[str, Any]], combination_idx: int,
+            collect_result: Callable[[Dict[str, Any]], None], additional_values: Dict[str, Any]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Evaluates the given parameter combinations (making use of the equivalence class cache, if any), collecting all results
+
+        :return: the list of values for each parameter combination (None if the combination was skipped)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(params_list)
+
+        def handle_result(i, values):
+            if values is None:
+                return
+            values.update(additional_values)
+            results[i] = values
+            collect_result(values)
+
+        indices_to_evaluate = []
+        for i, params in enumerate(params_list):
+            values = self._get_cached_values(params)
+            if values is not None:
+                handle_result(i, values)
+            elif not self._is_skipped(params):
+                indices_to_evaluate.append(i)
+
+        def handle_evaluation_result(i, values):
+            self._set_cached_values(params_list[i], values)
+            self._tell_skip_decider(params_list[i], values)
+            handle_result(i, values)
+
+        eval_args = (self.model_factory, metrics_evaluator, self.pruner, self.name)
+        if not self._is_parallel():
+            for i in indices_to_evaluate:
+                handle_evaluation_result(i, self._eval_params(*eval_args, combination_idx + i, self.model_save_directory,
+                    self.record_model_repr, **params_list[i]))
+        else:
+            executor = self._get_executor()
+            future_to_index = {executor.submit(self._eval_params, *eval_args, combination_idx + i, self.model_save_directory,
+                self.record_model_repr, **params_list[i]): i for i in indices_to_evaluate}
+            for future in as_completed(future_to_index):
+                handle_evaluation_result(future_to_index[future], future.result())
+        return results
+
+    def _successive_halving(self, metrics_evaluator: MetricsDictProvider, combinations: List[Dict[str, Any]], resource: Union[int, float],
+            metric_name: str, ascending: bool, combination_idx: int, collect_result: Callable[[Dict[str, Any]], None],
+            additional_values: Dict[str, Any]) -> int:
+        """
+        Applies successive halving to the given parameter combinations
+
+        :return: the updated combination index
+        """
+        rung = 0
+        while len(combinations) > 0:
+            budget = min(resource, self.max_resource)
+            self.log.info(f"Evaluating {len(combinations)} parameter combinations with {self.budget_param_name}={budget} "
+                f"(rung {rung}, {additional_values})")
+            params_list = [{**params, self.budget_param_name: budget} for params in combinations]
+            results = self._eval_params_list(metrics_evaluator, params_list, combination_idx, collect_result,
+                dict(additional_values, rung=rung))
+            combination_idx += len(params_list)
+            if budget >= self.max_resource:
+                break
+
+            # retain the best combinations for the next rung
+            evaluated = [(params, values[metric_name]) for params, values in zip(combinations, results) if values is not None]
+            evaluated.sort(key=lambda x: x[1], reverse=not ascending)
+            num_retained = math.ceil(len(evaluated) / self.reduction_factor)
+            if num_retained == len(evaluated):
+                break
+            combinations = [params for params, _ in evaluated[:num_retained]]
+            resource *= self.reduction_factor
+            rung += 1
+        return combination_idx
+
+    def run(self, metrics_evaluator: MetricsDictProvider, sort_column_name=None, ascending=True) -> "GridSearch.Result":
+        """
+        Runs the search. If csvResultsPath was provided in the constructor, each evaluation result will be saved
+        to that file directly after being computed
+
+        :param metrics_evaluator: the evaluator or cross-validator with which to evaluate models
+        :param sort_column_name: the name of the metric by which to rank parameter combinations (which is also used to sort the
+            data frame of results); must not be None
+        :param ascending: whether lower metric values are better (i.e. ascending=False means "higher is better")
+        :return: an object holding the results, where the parameters include the budget parameter
+        """
+        if sort_column_name is None:
+            raise ValueError("sort_column_name must be specified, as it determines the metric by which to rank parameter combinations")
+        values_tracker = self._create_values_tracker(metrics_evaluator)
+        params_metrics_collection = ParametersMetricsCollection(csv_path=self.csv_results_path, sort_column_name=sort_column_name,
+            ascending=ascending)
+
+        def collect_result(values):
+            if values_tracker is not None:
+                values_tracker.track_values(values)
+            params_metrics_collection.add_values(values)
+            self._log_intermediate_results(params_metrics_collection)
+
+        combinations = list(self._iter_param_combinations())
+        if not self.hyperband:
+            self._successive_halving(metrics_evaluator, combinations, self.min_resource, sort_column_name, ascending, 0, collect_result, {})
+        else:
+            rnd = Random(self.random_seed)
+            s_max = 0
+            while self.min_resource * self.reduction_factor ** (s_max + 1) <= self.max_resource:
+                s_max += 1
+            combination_idx = 0
+            for s in range(s_max, -1, -1):
+                n = math.ceil((s_max + 1) / (s + 1) * self.reduction_factor ** s)
+                bracket_combinations = rnd.sample(combinations, min(n, len(combinations)))
+                resource = self.min_resource * self.reduction_factor ** (s_max - s)
+                combination_idx = self._successive_halving(metrics_evaluator, bracket_combinations, resource, sort_column_name, ascending,
+                    combination_idx, collect_result, dict(bracket=s))
+
+        params_metrics_collection.close()
+        if values_tracker is not None:
+            values_tracker.close()
+        df = params_metrics_collection.get_data_frame()
+        self._log_final_results(df)
+        return self.Result(df, list(self.param_names) + [self.budget_param_name], default_metric_name=sort_column_name,
+            default_higher_is_better=not ascending)
 
 
 class SAHyperOpt(TrackingMixin):
     log = log.getChild(__qualname__)
+    LOG_RESULTS_INTERVAL = 10
 
     class State(SAState):
         def __init__(self, params: Dict[str, Any], random_state: Random, results: Dict, compute_metric: Callable[[Dict[str, Any]], float]):
@@ -462,7 +1122,11 @@ class SAHyperOpt(TrackingMixin):
             csv_results_path: Optional[str] = None,
             parameter_combination_equivalence_class_value_cache: ParameterCombinationEquivalenceClassValueCache = None,
             p0: float = 0.5,
-            p1: float = 0.0):
+            p1: float = 0.0,
+            pruner: Optional[Pruner] = None,
+            record_model_repr: bool = False,
+            warm_start_parameter_ranges: Optional[Dict[str, Union[Tuple[int, int], Tuple[float, float], List[Any]]]] = None,
+            num_warm_start_points: Optional[int] = None):
         """
         :param model_factory: a factory for the generation of models which is called with the current parameter combination
             (all keyword arguments), initially initialParameters
@@ -481,6 +1145,19 @@ class SAHyperOpt(TrackingMixin):
             to the current state's (for the mean observed evaluation delta)
         :param p1: the final probability (at the end of the optimisation) of accepting a state with an inferior evaluation
             to the current state's (for the mean observed evaluation delta)
+        :param pruner: a pruner with which to abort the evaluation of unpromising parameter combinations early, based on the
+            intermediate metrics reported by the metrics evaluator; for a pruned combination, the aggregated intermediate value
+            at which it was pruned is used as its metric value (which is neither stored in the results nor in the cache).
+            The pruner's metric should thus correspond to `metric_to_optimise`.
+        :param record_model_repr: whether to add the string representation of each model to the collected results
+            (column "str(model)"); as computing the representation can be costly for complex models, this is disabled by default
+        :param warm_start_parameter_ranges: if not None, the search is warm-started by evaluating a batch of parameter combinations
+            which are sampled from the given ranges using a (scrambled) Sobol sequence, starting simulated annealing from the best
+            combination found (including the initial parameters). The dictionary maps parameter names to either a tuple (min, max)
+            of ints or floats (range with inclusive bounds) or a list of discrete values; parameters that are not included retain
+            their initial values. Use an equivalence class value cache in order to avoid re-evaluating the start combination.
+        :param num_warm_start_points: the number of points to sample for the warm start; if None, use the smallest power of 2 that
+            is at least four times the number of parameters in `warm_start_parameter_ranges`
         """
         self.minimise_metric = minimise_metric
         self.evaluator_or_validator = metrics_evaluator
@@ -495,6 +1172,12 @@ class SAHyperOpt(TrackingMixin):
         self.parameter_combination_equivalence_class_value_cache = parameter_combination_equivalence_class_value_cache
         self.p0 = p0
         self.p1 = p1
+        self.pruner = pruner
+        self.record_model_repr = record_model_repr
+        self.warm_start_parameter_ranges = warm_start_parameter_ranges
+        self.num_warm_start_points = num_warm_start_points
+        self._num_trials = 0
+        self._values_tracker: Optional[BackgroundValuesTracker] = None
         self._sa = None
 
     @classmethod
@@ -503,9 +1186,10 @@ class SAHyperOpt(TrackingMixin):
             metrics_evaluator: MetricsDictProvider,
             parameters_metrics_collection: Optional[ParametersMetricsCollection],
             parameter_combination_equivalence_class_value_cache,
-            tracked_experiment: Optional[TrackedExperiment],
+            values_tracker: Optional[BackgroundValuesTracker],
+            record_model_repr: bool,
             **params):
-        if tracked_experiment is not None and metrics_evaluator.tracked_experiment is not None:
+        if values_tracker is not None and metrics_evaluator.tracked_experiment is not None:
             log.warning(f"Tracked experiment already set in evaluator, results will be tracked twice and"
                         f"might get overwritten!")
 
@@ -521,31 +1205,101 @@ class SAHyperOpt(TrackingMixin):
             cls.log.info(f"Got metrics {metrics} for {params}")
 
             values = dict(metrics)
-            values["str(model)"] = str(model)
+            if record_model_repr:
+                values["str(model)"] = str(model)
             values.update(**params)
-            if tracked_experiment is not None:
-                tracked_experiment.track_values(values)
+            if values_tracker is not None:
+                values_tracker.track_values(values)
             if parameters_metrics_collection is not None:
                 parameters_metrics_collection.add_values(values)
-                cls.log.info(f"Data frame with all results:\n\n{parameters_metrics_collection.get_data_frame().to_string()}\n")
+                if len(parameters_metrics_collection) % cls.LOG_RESULTS_INTERVAL == 0 or cls.log.isEnabledFor(logging.DEBUG):
+                    cls.log.info(f"Data frame with all results:\n\n{parameters_metrics_collection.get_data_frame().to_string()}\n")
             if parameter_combination_equivalence_class_value_cache is not None:
                 parameter_combination_equivalence_class_value_cache.set(params, metrics)
         return metrics
 
     def _compute_metric(self, params: Dict[str, Any]):
-        metrics = self._eval_params(self.model_factory, self.evaluator_or_validator, self.parameters_metrics_collection,
-            self.parameter_combination_equivalence_class_value_cache, self.tracked_experiment, **params)
-        metric_value = metrics[self.metric_to_optimise]
+        trial_id = self._num_trials
+        self._num_trials += 1
+        try:
+            with self.pruner.trial(self.evaluator_or_validator, trial_id) if self.pruner is not None else nullcontext():
+                metrics = self._eval_params(self.model_factory, self.evaluator_or_validator, self.parameters_metrics_collection,
+                    self.parameter_combination_equivalence_class_value_cache, self._values_tracker, self.record_model_repr, **params)
+            metric_value = metrics[self.metric_to_optimise]
+        except TrialPruned as e:
+            self.log.info(f"Parameter combination was pruned ({e}): {params}")
+            metric_value = e.value
         if not self.minimise_metric:
             return -metric_value
         return metric_value
 
+    @staticmethod
+    def _map_unit_value(u: float, value_range: Union[Tuple[int, int], Tuple[float, float], List[Any]]) -> Any:
+        """
+        :param u: a value in [0, 1)
+        :param value_range: a tuple (min, max) or a list of discrete values
+        :return: the corresponding value from the range
+        """
+        if isinstance(value_range, tuple):
+            lower, upper = value_range
+            if isinstance(lower, int) and isinstance(upper, int):
+                return lower + min(int(u * (upper - lower + 1)), upper - lower)
+            return float(lower + u * (upper - lower))
+        else:
+            return value_range[min(int(u * len(value_range)), len(value_range) - 1)]
+
+    def _find_warm_start_parameters(self, random_seed: int) -> Dict[str, Any]:
+        """
+        Evaluates the initial parameters and a batch of parameter combinations sampled via a scrambled Sobol sequence
+
+        :param random_seed: the random seed for the scrambling of the Sobol sequence
+        :return: the best parameter combination
+        """
+        from scipy.stats import qmc
+
+        param_names = list(self.warm_start_parameter_ranges.keys())
+        num_points = self.num_warm_start_points
+        if num_points is None:
+            num_points = 2 ** math.ceil(math.log2(4 * len(param_names)))
+        sampler = qmc.Sobol(d=len(param_names), scramble=True, seed=random_seed)
+        candidates = [dict(self.initial_parameters)]
+        for point in sampler.random(num_points):
+            params = dict(self.initial_parameters)
+            for param_name, u in zip(param_names, point):
+                params[param_name] = self._map_unit_value(u, self.warm_start_parameter_ranges[param_name])
+            candidates.append(params)
+        self.log.info(f"Warm-starting with {len(candidates)} parameter combinations")
+        best_params, best_cost = None, None
+        for params in candidates:
+            cost = self._compute_metric(params)
+            if best_cost is None or cost < best_cost:
+                best_params, best_cost = params, cost
+        self.log.info(f"Best parameter combination found in warm start: {best_params}")
+        return best_params
+
     def run(self, max_steps: Optional[int] = None, duration: Optional[float] = None, random_seed: int = 42, collect_stats: bool = True):
         sa = SimulatedAnnealing(lambda: SAProbabilitySchedule(None, SAProbabilityFunctionLinear(p0=self.p0, p1=self.p1)),
             self.ops_and_weights, max_steps=max_steps, duration=duration, random_seed=random_seed, collect_stats=collect_stats)
         results = {}
         self._sa = sa
-        sa.optimise(lambda r: self.State(self.initial_parameters, r, results, self._compute_metric))
+        if self.tracked_experiment is not None:
+            self._values_tracker = BackgroundValuesTracker(self.tracked_experiment)
+        completed = False
+        try:
+            initial_parameters = self.initial_parameters
+            if self.warm_start_parameter_ranges is not None:
+                initial_parameters = self._find_warm_start_parameters(random_seed)
+            sa.optimise(lambda r: self.State(initial_parameters, r, results, self._compute_metric))
+            if self.parameters_metrics_collection is not None and len(self.parameters_metrics_collection) > 0:
+                self.log.info(f"Data frame with all results:\n\n{self.parameters_metrics_collection.get_data_frame().to_string()}\n")
+            completed = True
+        finally:
+            if self.parameters_metrics_collection is not None:
+                self.parameters_metrics_collection.close()
+            if self._values_tracker is not None:
+                values_tracker, self._values_tracker = self._values_tracker, None
+                # propagate tracking errors only if they would not replace an exception raised by the search itself
+                values_tracker.close(raise_exceptions=completed)
         return results
 
     def get_simulated_annealing(self) -> SimulatedAnnealing:
@@ -589,6 +1343,13 @@ class OptionsGenerator(Generic[TKey, TValue], ABC):
         """
         return OptionsProduct(self, other)
 
+    def _get_product_factors(self) -> list[list[list[Option]]]:
+        """
+        :return: the list of factors whose Cartesian product yields the option combinations of this generator, where each factor
+            is given by the (materialised) list of option combinations of a non-product generator
+        """
+        return [list(self.iter_options())]
+
 
 class OptionsProduct(Generic[TKey, TValue], OptionsGenerator[TKey, TValue]):
     """An options generator that produces the cartesian product of two other generators"""
@@ -601,10 +1362,13 @@ class OptionsProduct(Generic[TKey, TValue], OptionsGenerator[TKey, TValue]):
         self.o1 = o1
         self.o2 = o2
 
+    def _get_product_factors(self) -> list[list[list[Option]]]:
+        return self.o1._get_product_factors() + self.o2._get_product_factors()
+
     def iter_options(self) -> Iterator[list[Option]]:
-        for r1 in self.o1.iter_options():
-            for r2 in self.o2.iter_options():
-                yield r1 + r2
+        # flatten (nested) products into a single product over all factors in order to avoid intermediate list concatenations
+        for combination in itertools.product(*self._get_product_factors()):
+            yield list(itertools.chain.from_iterable(combination))
 
 
 class OptionsGeneratorBase(Generic[TKey, TValue], OptionsGenerator[TKey, TValue], ABC):
@@ -649,9 +1413,8 @@ class OptionsMinMaxOf(Generic[TKey, TValue], OptionsGeneratorBase[TKey, TValue])
         self.n_max = n_max
 
     def iter_options(self) -> Iterator[list[Option]]:
-        for n in range(self.n_min, self.n_max + 1):
-            for result in itertools.combinations(self.options.values(), n):
-                yield list(result)
+        values = tuple(self.options.values())
+        return map(list, itertools.chain.from_iterable(itertools.combinations(values, n) for n in range(self.n_min, self.n_max + 1)))
 
 
 class OptionsOneOrNoneOf(Generic[TKey, TValue], OptionsMinMaxOf[TKey, TValue]):
@@ -682,5 +1445,19 @@ class OptionsSubsets(Generic[TKey, TValue], OptionsGeneratorBase[TKey, TValue]):
     """
 
     def iter_options(self) -> Iterator[list[Option]]:
-        for result in iter_subsets(self.options.values()):
-            yield list(result)
+        return map(list, iter_subsets(self.options.values()))
+
+    def iter_options_with_masks(self) -> Iterator[tuple[int, list[Option]]]:
+        """
+        Returns an iterator over the subsets (in the same order as `iter_options`), each paired with a bit mask identifying it,
+        where bit i is set if the i-th option is contained in the subset. The mask can, for instance, serve as a compact
+        cache key.
+
+        :return: an iterator of pairs (mask, subset)
+        """
+        values = list(self.options.values())
+        for indices in iter_subsets(range(len(values))):
+            mask = 0
+            for i in indices:
+                mask |= 1 << i
+            yield mask, [values[i] for i in indices]
@@ -1,3 +1,6 @@
+import logging
+import queue
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Generic, TypeVar, List
 
@@ -7,6 +10,8 @@ from ..util import count_none
 from ..util.deprecation import deprecated
 from ..vector_model import VectorModelBase
 
+log = logging.getLogger(__name__)
+
 
 class TrackingContext(ABC):
     def __init__(self, name: str, experiment: Optional["TrackedExperiment"]):
@@ -176,6 +181,89 @@ class TrackedExperiment(Generic[TContext], ABC):
             c.end()
 
 
+class BackgroundValuesTracker:
+    """
+    Passes values dictionaries on to a tracked experiment (via `track_values`) in a background thread, such that
+    (potentially slow, e.g. network-bound) tracking operations do not block the caller.
+    Call :meth:`close` (or use the instance as a context manager) to wait for all pending values to be tracked.
+    Exceptions raised by tracking operations are re-raised by :meth:`flush` and :meth:`close`.
+
+    NOTE: The tracked experiment's `track_values` is called from the background thread, possibly while the caller's thread
+    is using the experiment (e.g. via an open tracking context). The experiment must therefore be thread-safe; this is not
+    the case for implementations which rely on thread-local or global state (such as an active run in mlflow's fluent API).
+    """
+    _STOP = object()
+
+    def __init__(self, tracked_experiment: TrackedExperiment):
+        """
+        :param tracked_experiment: the experiment to which values shall be passed
+        """
+        self.tracked_experiment = tracked_experiment
+        self._queue = queue.Queue()
+        self._exceptions: List[Exception] = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    break
+                self.tracked_experiment.track_values(item)
+            except Exception as e:
+                log.exception(f"Failed to track values in {self.tracked_experiment}")
+                self._exceptions.append(e)
+            finally:
+                self._queue.task_done()
+
+    def track_values(self, values_dict: Dict[str, Any]):
+        """
+        Enqueues the given values for tracking
+
+        :param values_dict: the values to track
+        """
+        self._queue.put(dict(values_dict))
+
+    def _raise_tracking_exception(self):
+        if len(self._exceptions) > 0:
+            exceptions, self._exceptions = self._exceptions, []
+            if len(exceptions) > 1:
+                log.error(f"{len(exceptions)} tracking operations failed; raising the first exception")
+            raise exceptions[0]
+
+    def flush(self):
+        """
+        Waits until all values that were enqueued so far have been tracked, raising the first exception that occurred
+        in a tracking operation (if any)
+        """
+        self._queue.join()
+        self._raise_tracking_exception()
+
+    def close(self, raise_exceptions: bool = True):
+        """
+        Waits until all pending values have been tracked and stops the background thread, raising the first exception that
+        occurred in a tracking operation (if any)
+
+        :param raise_exceptions: whether to raise exceptions that occurred in tracking operations; if False, they are only
+            logged (e.g. because another exception is already being propagated)
+        """
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        if raise_exceptions:
+            self._raise_tracking_exception()
+        elif len(self._exceptions) > 0:
+            log.error(f"{len(self._exceptions)} tracking operations failed (exceptions were logged above)")
+            self._exceptions = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
 class TrackingMixin(ABC):
     _objectId2trackedExperiment = {}
 
@@ -182,12 +182,21 @@ def is_s3_path(path: str):
 
 
 class S3Object:
+    MULTIPART_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+    """
+    the size of the parts in which data written via `open_file` is uploaded (S3 requires at least 5 MiB for all but the last part)
+    """
+    READ_BUFFER_SIZE = 1024 * 1024
+
     def __init__(self, path):
         assert is_s3_path(path)
         self.path = path
         self.bucket, self.object = self.path[5:].split("/", 1)
 
     class OutputFile:
+        """
+        File-like object which collects all data in memory and uploads it upon exit
+        """
         def __init__(self, s3_object: "S3Object"):
             self.s3Object = s3_object
             self.buffer = io.BytesIO()
@@ -201,16 +210,114 @@ class S3Object:
         def __exit__(self, exc_type, exc_val, exc_tb):
             self.s3Object.put(self.buffer.getvalue())
 
+    class StreamingOutputFile:
+        """
+        File-like object which uploads the data that is written to it in parts (using a multipart upload), such that the full
+        content need not be held in memory. Uploads take place in a background thread (overlapping with further writes),
+        with at most one part being uploaded while the next one is being filled.
+        Content which does not exceed the part size is uploaded via a single regular request upon exit.
+        If an exception occurs within the `with` block, the multipart upload is aborted.
+        """
+        def __init__(self, s3_object: "S3Object"):
+            self.s3Object = s3_object
+            self._buffer = bytearray()
+            self._client = None
+            self._upload_id = None
+            self._parts = []
+            self._executor = None
+            self._pending_upload = None
+
+        def write(self, data) -> int:
+            self._buffer += data
+            if len(self._buffer) >= self.s3Object.MULTIPART_UPLOAD_PART_SIZE:
+                self._upload_part()
+            return len(data)
+
+        def _upload_part(self):
+            from concurrent.futures import ThreadPoolExecutor
+            if self._upload_id is None:
+                self._client = self.s3Object._get_session().client("s3")
+                self._upload_id = self._client.create_multipart_upload(Bucket=self.s3Object.bucket, Key=self.s3Object.object)["UploadId"]
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._wait_for_pending_upload()
+            part_number = len(self._parts) + 1
+            body = bytes(self._buffer)
+            self._buffer = bytearray()
+            self._pending_upload = self._executor.submit(self._client.upload_part, Bucket=self.s3Object.bucket, Key=self.s3Object.object,
+                UploadId=self._upload_id, PartNumber=part_number, Body=body)
+            self._parts.append({"PartNumber": part_number})
+
+        def _wait_for_pending_upload(self):
+            if self._pending_upload is not None:
+                self._parts[-1]["ETag"] = self._pending_upload.result()["ETag"]
+                self._pending_upload = None
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if self._upload_id is None:
+                if exc_type is None:
+                    self.s3Object.put(bytes(self._buffer))
+                return
+            try:
+                if exc_type is None:
+                    try:
+                        if len(self._buffer) > 0:
+                            self._upload_part()
+                        self._wait_for_pending_upload()
+                        self._client.complete_multipart_upload(Bucket=self.s3Object.bucket, Key=self.s3Object.object,
+                            UploadId=self._upload_id, MultipartUpload={"Parts": self._parts})
+                    except BaseException:
+                        self._abort_multipart_upload()
+                        raise
+                else:
+                    self._abort_multipart_upload()
+            finally:
+                self._executor.shutdown(wait=True)
+
+        def _abort_multipart_upload(self):
+            self._client.abort_multipart_upload(Bucket=self.s3Object.bucket, Key=self.s3Object.object, UploadId=self._upload_id)
+
+    class _InputStream(io.RawIOBase):
+        def __init__(self, body):
+            self._body = body
+
+        def readable(self):
+            return True
+
+        def readinto(self, b) -> int:
+            data = self._body.read(len(b))
+            n = len(data)
+            b[:n] = data
+            return n
+
+        def close(self):
+            self._body.close()
+            super().close()
+
     def get_file_content(self):
         return self._get_s3_object().get()['Body'].read()
 
-    def open_file(self, mode):
+    def open_file(self, mode, streaming: bool = False):
+        """
+        :param mode: the mode ("rb" or "wb")
+        :param streaming: whether to stream the object's content rather than holding it in memory in full. For mode "rb",
+            the object is read from the network while it is being consumed; for mode "wb", the written data is uploaded
+            in parts via a multipart upload (see `StreamingOutputFile`)
+        :return: a file-like object, which, for mode "wb", must be used as a context manager (the upload being completed
+            upon exit)
+        """
         assert mode in ("wb", "rb")
         if mode == "rb":
+            if streaming:
+                return io.BufferedReader(self._InputStream(self._get_s3_object().get()['Body']), buffer_size=self.READ_BUFFER_SIZE)
             content = self.get_file_content()
             return io.BytesIO(content)
 
         elif mode == "wb":
+            if streaming:
+                return self.StreamingOutputFile(self)
             return self.OutputFile(self)
 
         else:
@@ -219,10 +326,13 @@ class S3Object:
     def put(self, obj: bytes):
         self._get_s3_object().put(Body=obj)
 
-    def _get_s3_object(self):
+    @staticmethod
+    def _get_session():
         import boto3
-        session = boto3.session.Session(profile_name=os.getenv("AWS_PROFILE"))
-        s3 = session.resource("s3")
+        return boto3.session.Session(profile_name=os.getenv("AWS_PROFILE"))
+
+    def _get_s3_object(self):
+        s3 = self._get_session().resource("s3")
         return s3.Bucket(self.bucket).Object(self.object)
 
 
@@ -1,46 +1,252 @@
+import functools
+import io
 import logging
+import mmap
 import os
 import pickle
-from contextlib import contextmanager
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, ExitStack
 from copy import copy
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Tuple, Union, Literal, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Union, Literal, Optional
 
 from .io import S3Object, is_s3_path
 
 log = logging.getLogger(__name__)
 
+PickleCompression = Literal["none", "bz2", "zstd", "lz4"]
+DEFAULT_BUFFER_SIZE = 1 << 20
+"""
+the default size (in bytes) of the buffer used for reading/writing local pickle files; the larger the buffer, the fewer
+system calls are required for large pickles (the default buffer size of Python's built-in `open` being only 8 KiB)
+"""
+
+
+@contextmanager
+def _open_bz2_file(path: str, mode: str, buffer_size: int):
+    import bz2
+    with open(path, mode, buffering=buffer_size) as raw_file, bz2.BZ2File(raw_file, mode) as f:
+        yield f
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Could not import zstandard, did you install it?")
+    return zstandard
+
+
+@functools.lru_cache(maxsize=16)
+def _load_zstd_dict(path: str, mtime: float):
+    """
+    :param path: the path of the dictionary file
+    :param mtime: the modification time of the file (such that cached dictionaries are invalidated when the file changes)
+    :return: the dictionary
+    """
+    with open(path, "rb") as f:
+        return _import_zstandard().ZstdCompressionDict(f.read())
+
+
+@contextmanager
+def _open_zstd_file(path: str, mode: str, buffer_size: int, zstd_dict_path: Optional[str] = None):
+    zstandard = _import_zstandard()
+    dict_data = _load_zstd_dict(zstd_dict_path, os.path.getmtime(zstd_dict_path)) if zstd_dict_path is not None else None
+    with open(path, mode, buffering=buffer_size) as raw_file:
+        if mode == "rb":
+            decompressor = zstandard.ZstdDecompressor(dict_data=dict_data, max_window_size=2 ** 31)
+            # the buffered reader adds `readline` and `peek` (as required by the pickle module for some protocols)
+            with decompressor.stream_reader(raw_file, closefd=False) as reader, io.BufferedReader(reader, buffer_size) as f:
+                yield f
+        else:
+            # use zstd's internal worker threads (one per logical CPU) for compression
+            compressor = zstandard.ZstdCompressor(level=3, dict_data=dict_data, threads=-1)
+            with compressor.stream_writer(raw_file, closefd=False) as f:
+                yield f
+
+
+@contextmanager
+def _open_lz4_file(path: str, mode: str, buffer_size: int):
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError("Could not import lz4, did you install it?")
+    # prioritise speed over compression ratio when writing (fastest compression level, no content checksum)
+    write_options = dict(block_size=lz4.frame.BLOCKSIZE_MAX1MB, content_checksum=False, compression_level=0) if mode == "wb" else {}
+    with open(path, mode, buffering=buffer_size) as raw_file, lz4.frame.open(raw_file, mode, **write_options) as f:
+        yield f
+
+
+def train_pickle_zstd_dict(sample_paths: Iterable[Union[str, Path]], out_path: Union[str, Path], dict_size: int = 65536) -> None:
+    """
+    Trains a zstd compression dictionary on the given sample pickle files, which can subsequently be passed to
+    `dump_pickle` and `load_pickle` (parameter `zstd_dict_path`) in order to more effectively compress (small) pickles
+    with similar content, e.g. the models saved in a hyperparameter search. Requires the package zstandard.
+
+    :param sample_paths: the paths of the (local) sample pickle files; compression is inferred from filenames
+    :param out_path: the path of the dictionary file to write
+    :param dict_size: the maximum size (in bytes) of the dictionary
+    """
+    samples = []
+    for path in sample_paths:
+        path = str(path)
+        with _open_file(path, "rb", _resolve_compression(path, None, None), DEFAULT_BUFFER_SIZE) as f:
+            samples.append(f.read())
+    zstd_dict = _import_zstandard().train_dictionary(dict_size, samples)
+    with open(out_path, "wb") as f:
+        f.write(zstd_dict.as_bytes())
+
+
+_COMPRESSED_FILE_OPENERS: Dict[str, Callable[[str, str, int], Any]] = {
+    "bz2": _open_bz2_file,
+    "zstd": _open_zstd_file,
+    "lz4": _open_lz4_file,
+}
+_COMPRESSION_FILENAME_SUFFIXES: Dict[str, Tuple[str, ...]] = {
+    "bz2": (".bz2",),
+    "zstd": (".zst", ".zstd"),
+    "lz4": (".lz4",),
+}
+
+
+def _resolve_compression(path: str, compression: Optional[str], use_bz2: Optional[bool]) -> str:
+    """
+    :param path: the file path
+    :param compression: the compression that was explicitly specified (if any)
+    :param use_bz2: the legacy flag for bzip2 compression (if any)
+    :return: the compression to use
+    """
+    if compression is None:
+        if use_bz2 is not None:
+            return "bz2" if use_bz2 else "none"
+        for c, suffixes in _COMPRESSION_FILENAME_SUFFIXES.items():
+            if path.endswith(suffixes):
+                return c
+        return "none"
+    if compression != "none" and compression not in _COMPRESSED_FILE_OPENERS:
+        raise ValueError(f"Unknown compression '{compression}'. Supported compressions are 'none', "
+            f"{', '.join(repr(c) for c in _COMPRESSED_FILE_OPENERS)}")
+    return compression
+
+
+@contextmanager
+def _open_file(path: str, mode: str, compression: str, buffer_size: int, zstd_dict_path: Optional[str] = None):
+    """
+    :param path: a path to a local file or an S3 path (starting with "s3://")
+    :param mode: the mode ("rb" or "wb")
+    :param compression: the compression to apply
+    :param buffer_size: the buffer size to use for local files
+    :param zstd_dict_path: the path of a zstd compression dictionary to use (for compression "zstd" only)
+    :return: a context manager providing the file object
+    """
+    opener = _COMPRESSED_FILE_OPENERS.get(compression)
+    if zstd_dict_path is not None:
+        if compression != "zstd":
+            raise ValueError(f"A zstd dictionary can only be used with compression 'zstd', got '{compression}'")
+        opener = functools.partial(_open_zstd_file, zstd_dict_path=str(zstd_dict_path))
+    if is_s3_path(path):
+        if compression != "none":
+            raise ValueError(f"Compression ('{compression}') is not supported for S3 paths")
+        with S3Object(path).open_file(mode, streaming=True) as f:
+            yield f
+    elif compression != "none":
+        with opener(path, mode, buffer_size) as f:
+            yield f
+    else:
+        with open(path, mode, buffering=buffer_size) as f:
+            yield f
+
+
+OUT_OF_BAND_BUFFERS_FILENAME_SUFFIX = ".buffers"
+_OUT_OF_BAND_BUFFER_ALIGNMENT = 64
+
+
+def _out_of_band_buffers_path(pickle_path: str) -> str:
+    return pickle_path + OUT_OF_BAND_BUFFERS_FILENAME_SUFFIX
+
+
+def _write_out_of_band_buffers(path: str, buffers: List[pickle.PickleBuffer], buffer_size: int):
+    """
+    Writes the given buffers to a file, which starts with a header (the number of buffers followed by the offset and length
+    of each buffer, all as unsigned 64-bit integers), followed by the (aligned) buffer contents
+
+    :param path: the path of the file to write
+    :param buffers: the buffers
+    :param buffer_size: the size of the write buffer
+    """
+    views = [b.raw() for b in buffers]
+    header_size = 8 * (1 + 2 * len(views))
+    offsets = []
+    offset = header_size
+    for view in views:
+        offset = -(-offset // _OUT_OF_BAND_BUFFER_ALIGNMENT) * _OUT_OF_BAND_BUFFER_ALIGNMENT
+        offsets.append(offset)
+        offset += view.nbytes
+    header = [len(views)]
+    for offset, view in zip(offsets, views):
+        header.extend((offset, view.nbytes))
+    with open(path, "wb", buffering=buffer_size) as f:
+        f.write(struct.pack(f"<{len(header)}Q", *header))
+        position = header_size
+        for offset, view in zip(offsets, views):
+            f.write(bytes(offset - position))
+            f.write(view)
+            position = offset + view.nbytes
+
+
+def _read_out_of_band_buffers(path: str) -> List[memoryview]:
+    """
+    Reads buffers that were written via `_write_out_of_band_buffers`, memory-mapping the file (copy-on-write, such that the
+    objects which are reconstructed from the buffers are writable without the file being modified)
+
+    :param path: the path of the file to read
+    :return: the list of buffers
+    """
+    with open(path, "rb") as f:
+        num_buffers, = struct.unpack("<Q", f.read(8))
+        if num_buffers == 0:
+            return []
+        header = struct.unpack(f"<{2 * num_buffers}Q", f.read(16 * num_buffers))
+        file_view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+    return [file_view[offset:offset + length] for offset, length in zip(header[::2], header[1::2])]
+
 
 def load_pickle(path: Union[str, Path],
         backend: Literal["pickle", "cloudpickle", "joblib"] = "pickle",
-        use_bz2: Optional[bool] = None):
+        use_bz2: Optional[bool] = None,
+        compression: Optional[PickleCompression] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        out_of_band: bool = False,
+        zstd_dict_path: Optional[Union[str, Path]] = None):
     """
     :param path: the path from which to load the pickle; may be an S3 path starting with "s3://"
     :param backend: the backend to use
-    :param use_bz2: whether to use bzip2 to decompress the file prior to loading it; if None, infer from filename
-        (enabled if it ends with ".bz2")
+    :param use_bz2: [deprecated, use `compression`] whether to use bzip2 to decompress the file prior to loading it;
+        has an effect only if `compression` is None
+    :param compression: the compression with which the file was written; if None (and `use_bz2` is None), infer from filename
+        ("bz2" if it ends with ".bz2", "zstd" if it ends with ".zst" or ".zstd", "lz4" if it ends with ".lz4", "none" otherwise).
+        Compression "zstd" requires the package zstandard, "lz4" requires the package lz4.
+    :param buffer_size: the size (in bytes) of the read buffer to use for local files
+    :param out_of_band: whether the pickle was saved with out-of-band buffers (see `dump_pickle`); the buffers are memory-mapped
+        rather than read
+    :param zstd_dict_path: the path of the zstd compression dictionary with which the file was compressed (if any);
+        see `train_pickle_zstd_dict`
     :return:
     """
     if isinstance(path, Path):
         path = str(path)
 
-    if use_bz2 is None:
-        use_bz2 = path.endswith(".bz2")
+    compression = _resolve_compression(path, compression, use_bz2)
+    out_of_band_buffers = None
+    if out_of_band:
+        if backend != "pickle":
+            raise ValueError(f"Out-of-band buffers are not supported for backend '{backend}'")
+        out_of_band_buffers = _read_out_of_band_buffers(_out_of_band_buffers_path(path))
 
-    @contextmanager
     def open_file():
-        if is_s3_path(path):
-            if use_bz2:
-                raise ValueError("Flag use_bz2 not supported for S3 paths")
-            yield S3Object(path).open_file("rb")
-        else:
-            if use_bz2:
-                import bz2
-                with bz2.BZ2File(path, 'rb') as _file:
-                    yield _file
-            else:
-                with open(path, "rb") as _file:
-                    yield _file
+        return _open_file(path, "rb", compression, buffer_size, zstd_dict_path=zstd_dict_path)
 
     def read_file(f):
         def _load_with_error_log(loader: Callable):
@@ -51,12 +257,14 @@ def load_pickle(path: Union[str, Path],
                 raise e
 
         if backend == "pickle":
-            return _load_with_error_log(pickle.load)
+            return _load_with_error_log(lambda file: pickle.load(file, buffers=out_of_band_buffers))
         elif backend == "cloudpickle":
             import cloudpickle
             return _load_with_error_log(cloudpickle.load)
         elif backend == "joblib":
             import joblib
+            if not f.seekable():  # joblib requires seeking (not supported by some decompression streams)
+                f = io.BytesIO(f.read())
             return joblib.load(f)
         else:
             raise ValueError(f"Unknown backend '{backend}'. Supported backends are 'pickle', 'joblib' and 'cloudpickle'")
@@ -69,35 +277,49 @@ def dump_pickle(obj,
         pickle_path: Union[str, Path],
         backend: Literal["pickle", "cloudpickle", "joblib"] = "pickle",
         protocol=pickle.HIGHEST_PROTOCOL,
-        use_bz2: Optional[bool] = None) -> None:
+        use_bz2: Optional[bool] = None,
+        compression: Optional[PickleCompression] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        out_of_band: bool = False,
+        zstd_dict_path: Optional[Union[str, Path]] = None) -> None:
     """
     :param obj: the object to pickle
     :param pickle_path: either a path to a local file or an S3 path (starting with "s3://")
     :param backend: the backend to use
     :param protocol: the protocol version to use for backend "pickle"
-    :param use_bz2: whether to use bzip2 to compress the pickle file; not supported for S3 paths;
-        if None, infer from filename (enabled if it ends with ".bz2")
+    :param use_bz2: [deprecated, use `compression`] whether to use bzip2 to compress the pickle file;
+        has an effect only if `compression` is None
+    :param compression: the compression to apply; not supported for S3 paths. If None (and `use_bz2` is None), infer from
+        filename ("bz2" if it ends with ".bz2", "zstd" if it ends with ".zst" or ".zstd", "lz4" if it ends with ".lz4",
+        "none" otherwise). Options:
+
+        * "none": no compression
+        * "zstd": good compression ratio at high speed (requires the package zstandard); recommended for archival
+        * "lz4": very fast compression at a lower compression ratio (requires the package lz4); recommended where write
+          latency matters most, e.g. for checkpoints that are frequently written
+        * "bz2": high compression ratio but slow; mainly for compatibility with existing files
+    :param buffer_size: the size (in bytes) of the write buffer to use for local files
+    :param out_of_band: whether to store large contiguous data buffers (e.g. of numpy arrays) out of band, i.e. in a separate file
+        (`pickle_path` with suffix ".buffers") rather than in the pickle stream itself, avoiding copies of the data;
+        the buffers file is not compressed. Supported only for local paths, backend "pickle" and protocol 5 or higher.
+        The pickle must be loaded with `out_of_band=True`.
+    :param zstd_dict_path: the path of a zstd compression dictionary to use for compression "zstd" (see
+        `train_pickle_zstd_dict`); the same dictionary must be passed to `load_pickle`
     """
     if isinstance(pickle_path, Path):
         pickle_path = str(pickle_path)
 
-    if use_bz2 is None:
-        use_bz2 = pickle_path.endswith(".bz2")
+    compression = _resolve_compression(pickle_path, compression, use_bz2)
+    out_of_band_buffers: Optional[List[pickle.PickleBuffer]] = None
+    if out_of_band:
+        if protocol < 0:  # as in the pickle module, negative values select the highest protocol
+            protocol = pickle.HIGHEST_PROTOCOL
+        if backend != "pickle" or protocol < 5 or is_s3_path(pickle_path):
+            raise ValueError("Out-of-band buffers require backend 'pickle', protocol 5 or higher and a local path")
+        out_of_band_buffers = []
 
-    @contextmanager
     def open_file():
-        if is_s3_path(pickle_path):
-            if use_bz2:
-                raise ValueError("Flag use_bz2 not supported for S3 paths")
-            yield S3Object(pickle_path).open_file("wb")
-        else:
-            if use_bz2:
-                import bz2
-                with bz2.BZ2File(pickle_path, 'wb') as _file:
-                    yield _file
-            else:
-                with open(pickle_path, "wb") as _file:
-                    yield _file
+        return _open_file(pickle_path, "wb", compression, buffer_size, zstd_dict_path=zstd_dict_path)
 
     dir_name = os.path.dirname(pickle_path)
     if dir_name != "":
@@ -105,7 +327,8 @@ def dump_pickle(obj,
     with open_file() as f:
         if backend == "pickle":
             try:
-                pickle.dump(obj, f, protocol=protocol)
+                pickle.dump(obj, f, protocol=protocol,
+                    buffer_callback=out_of_band_buffers.append if out_of_band_buffers is not None else None)
             except AttributeError as e:
                 failing_paths = PickleFailureDebugger.debug_failure(obj)
                 raise AttributeError(f"Cannot pickle paths {failing_paths} of {obj}: {str(e)}")
@@ -117,6 +340,127 @@ def dump_pickle(obj,
             cloudpickle.dump(obj, f, protocol=protocol)
         else:
             raise ValueError(f"Unknown backend '{backend}'. Supported backends are 'pickle', 'joblib' and 'cloudpickle'")
+    if out_of_band_buffers is not None:
+        _write_out_of_band_buffers(_out_of_band_buffers_path(pickle_path), out_of_band_buffers, buffer_size)
+
+
+_dump_executor: Optional[ThreadPoolExecutor] = None
+_dump_executor_lock = threading.Lock()
+
+
+def _get_dump_executor() -> ThreadPoolExecutor:
+    global _dump_executor
+    with _dump_executor_lock:
+        if _dump_executor is None:
+            _dump_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="dump_pickle")
+        return _dump_executor
+
+
+def _write_pickled_bytes(data: bytes, pickle_path: str, compression: str, buffer_size: int) -> None:
+    dir_name = os.path.dirname(pickle_path)
+    if dir_name != "":
+        os.makedirs(dir_name, exist_ok=True)
+    with _open_file(pickle_path, "wb", compression, buffer_size) as f:
+        f.write(data)
+
+
+def dump_pickle_async(obj,
+        pickle_path: Union[str, Path],
+        protocol=pickle.HIGHEST_PROTOCOL,
+        compression: Optional[PickleCompression] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE) -> Future:
+    """
+    Pickles the given object (using backend "pickle") in the calling thread and writes the result to the given path
+    (applying compression, if any) in a background thread, such that the caller is not blocked by compression and IO.
+    Since the object is serialised before the function returns, it may safely be modified afterwards.
+    Pending writes are completed before the interpreter exits.
+
+    :param obj: the object to pickle
+    :param pickle_path: either a path to a local file or an S3 path (starting with "s3://")
+    :param protocol: the pickle protocol version to use
+    :param compression: the compression to apply (see `dump_pickle`); if None, infer from filename
+    :param buffer_size: the size (in bytes) of the write buffer to use for local files
+    :return: a future which completes once the file has been written (and which provides any exception that occurred
+        while writing)
+    """
+    pickle_path = str(pickle_path)
+    compression = _resolve_compression(pickle_path, compression, None)
+    try:
+        data = pickle.dumps(obj, protocol=protocol)
+    except AttributeError as e:
+        failing_paths = PickleFailureDebugger.debug_failure(obj)
+        raise AttributeError(f"Cannot pickle paths {failing_paths} of {obj}: {str(e)}")
+    return _get_dump_executor().submit(_write_pickled_bytes, data, pickle_path, compression, buffer_size)
+
+
+class SharedMemoDumper:
+    """
+    Sequentially pickles several objects to the same (local) file using a single pickler, whose memo persists across objects,
+    such that objects which are shared between them (e.g. common components of models that are saved in a loop) are
+    serialised only once. The objects must be loaded jointly via `load_shared_memo_pickles`.
+
+    Note that, because the memo refers to objects by identity, a shared object which is modified after having been dumped
+    is stored in the state it had when it was first dumped. Furthermore, the memo keeps all dumped objects alive until the
+    dumper is closed.
+    """
+    def __init__(self, pickle_path: Union[str, Path],
+            protocol=pickle.HIGHEST_PROTOCOL,
+            compression: Optional[PickleCompression] = None,
+            buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        :param pickle_path: the path of the local file to write
+        :param protocol: the pickle protocol version to use
+        :param compression: the compression to apply (see `dump_pickle`); if None, infer from filename
+        :param buffer_size: the size (in bytes) of the write buffer
+        """
+        pickle_path = str(pickle_path)
+        dir_name = os.path.dirname(pickle_path)
+        if dir_name != "":
+            os.makedirs(dir_name, exist_ok=True)
+        self._exit_stack = ExitStack()
+        f = self._exit_stack.enter_context(_open_file(pickle_path, "wb", _resolve_compression(pickle_path, compression, None),
+            buffer_size))
+        self._pickler = pickle.Pickler(f, protocol=protocol)
+
+    def dump(self, obj) -> None:
+        """
+        :param obj: the object to pickle
+        """
+        self._pickler.dump(obj)
+
+    def close(self) -> None:
+        """
+        Closes the file (and releases the memo)
+        """
+        self._exit_stack.close()
+        self._pickler = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def load_shared_memo_pickles(path: Union[str, Path],
+        compression: Optional[PickleCompression] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE) -> Iterator[Any]:
+    """
+    Loads the objects that were written via `SharedMemoDumper`
+
+    :param path: the path of the local file to read
+    :param compression: the compression with which the file was written; if None, infer from filename
+    :param buffer_size: the size (in bytes) of the read buffer
+    :return: an iterator over the objects (in the order in which they were dumped)
+    """
+    path = str(path)
+    with _open_file(path, "rb", _resolve_compression(path, compression, None), buffer_size) as f:
+        unpickler = pickle.Unpickler(f)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
 
 
 class PickleFailureDebugger:
@@ -126,47 +470,99 @@ class PickleFailureDebugger:
 
     enabled = False  # global flag controlling the behaviour of logFailureIfEnabled
 
-    @classmethod
-    def _debug_failure(cls, obj, path, failures, handled_object_ids):
-        if id(obj) in handled_object_ids:
-            return
-        handled_object_ids.add(id(obj))
-
-        try:
-            pickle.dumps(obj)
-        except:
-            # determine dictionary of children to investigate (if any)
-            if hasattr(
-                obj, '__dict__'
-            ):  # Because of strange behaviour of getstate, here try-except is used instead of if-else
-                try:  # Because of strange behaviour of getattr(_, '__getstate__'), we here use try-except
-                    d = obj.__getstate__()
-                    if type(d) != dict:
-                        d = {"state": d}
-                except:
-                    d = obj.__dict__
-            elif type(obj) == dict:
-                d = obj
-            elif type(obj) in (list, tuple, set):
-                d = dict(enumerate(obj))
-            else:
-                d = {}
+    _TRIVIALLY_PICKLABLE_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes))
+    _CHILD_EXTRACTORS: Dict[type, Callable[[Any], Dict[Any, Any]]] = {
+        dict: lambda o: o,
+        list: lambda o: dict(enumerate(o)),
+        tuple: lambda o: dict(enumerate(o)),
+        set: lambda o: dict(enumerate(o)),
+    }
+    """
+    mapping from (exact) container types to functions extracting the children to investigate
+    """
 
-            # recursively test children
-            have_failed_child = False
-            for key, child in d.items():
-                child_path = list(path) + [f"{key}[{child.__class__.__name__}]"]
-                have_failed_child = cls._debug_failure(
-                    child, child_path, failures, handled_object_ids
-                ) or have_failed_child
+    class _Frame:
+        def __init__(self, obj, path: List[str]):
+            self.obj = obj
+            self.path = path
+            self.children: Optional[List[Tuple[Any, List[str]]]] = None
 
-            if not have_failed_child:
-                failures.append(path)
+    class _DiscardingWriter:
+        def write(self, data):
+            pass
 
+    @classmethod
+    def _is_picklable(cls, obj) -> bool:
+        # pickle to a writer which discards all data (rather than creating the pickled bytes in memory), treating all
+        # buffers (e.g. numpy array data) as out-of-band, such that they are not even passed to the writer
+        try:
+            pickle.Pickler(cls._DiscardingWriter(), protocol=pickle.HIGHEST_PROTOCOL, buffer_callback=lambda buf: None).dump(obj)
             return True
-        else:
+        except Exception:
             return False
 
+    @classmethod
+    def _get_children(cls, obj) -> Dict[Any, Any]:
+        """
+        :param obj: an object
+        :return: a dictionary of children to investigate (which is empty if there are none)
+        """
+        extractor = cls._CHILD_EXTRACTORS.get(type(obj))
+        if extractor is not None:
+            return extractor(obj)
+        if hasattr(obj, '__dict__'):  # Because of strange behaviour of getstate, here try-except is used instead of if-else
+            try:  # Because of strange behaviour of getattr(_, '__getstate__'), we here use try-except
+                d = obj.__getstate__()
+                if type(d) != dict:
+                    d = {"state": d}
+            except Exception:
+                d = obj.__dict__
+        else:
+            d = {}
+        return d
+
+    @classmethod
+    def _debug_failure(cls, obj, path: List[str], failures: List[List[str]]) -> bool:
+        """
+        Tests whether the given object can be pickled, investigating the children of objects that cannot be pickled
+        (depth-first, using an explicit stack rather than recursion).
+        The paths of objects which cannot be pickled but whose children can all be pickled are added to `failures`
+        (in post-order).
+        Every object is tested only once; objects which are reached again via a different path are assigned the
+        result that was determined previously (objects whose investigation is still in progress, i.e. cyclic references,
+        are considered to be picklable).
+
+        :param obj: the object to test
+        :param path: the path of the object
+        :param failures: the list to which to add the paths of failures
+        :return: whether pickling of the object failed
+        """
+        failed: Dict[int, bool] = {}
+        handled_objects = []  # keeps all handled objects alive, such that their ids remain unique
+        stack = [cls._Frame(obj, path)]
+        while stack:
+            frame = stack[-1]
+            if frame.children is None:
+                obj_id = id(frame.obj)
+                if obj_id in failed:
+                    stack.pop()
+                    continue
+                handled_objects.append(frame.obj)
+                failed[obj_id] = False
+                if type(frame.obj) in cls._TRIVIALLY_PICKLABLE_TYPES or cls._is_picklable(frame.obj):
+                    stack.pop()
+                    continue
+                frame.children = [(child, list(frame.path) + [f"{key}[{child.__class__.__name__}]"])
+                    for key, child in cls._get_children(frame.obj).items()]
+                for child, child_path in reversed(frame.children):
+                    stack.append(cls._Frame(child, child_path))
+            else:
+                stack.pop()
+                if not any(failed[id(child)] for child, _ in frame.children):
+                    failures.append(frame.path)
+                failed[id(frame.obj)] = True
+        return failed[id(obj)]
+
     @classmethod
     def debug_failure(cls, obj) -> List[str]:
         """
@@ -175,9 +571,8 @@ class PickleFailureDebugger:
         :param obj: the object for which to recursively test pickling
         :return: a list of object paths that failed to pickle
         """
-        handled_object_ids = set()
         failures = []
-        cls._debug_failure(obj, [obj.__class__.__name__], failures, handled_object_ids)
+        cls._debug_failure(obj, [obj.__class__.__name__], failures)
         return [".".join(l) for l in failures]
 
     @classmethod
@@ -278,6 +673,23 @@ def setstate(
         obj.__dict__ = state
 
 
+def _is_equal_to_default(value, default) -> bool:
+    """
+    :param value: a property value
+    :param default: the default value
+    :return: whether the value is known to be equal to the default value; comparisons which fail or which do not produce a
+        scalar truth value (e.g. element-wise comparisons involving numpy arrays or pandas objects) indicate inequality
+    """
+    try:
+        result = value == default
+    except Exception:
+        return False
+    if result is True or result is False:
+        return result
+    # numpy scalars (including the results of comparisons of numpy scalars) have an empty shape
+    return getattr(result, "shape", None) == () and bool(result)
+
+
 def getstate(
     cls,
     obj,
@@ -299,7 +711,8 @@ def getstate(
     :param override_properties: a mapping from property names to values specifying (new or existing) properties which are to be set;
         use this to set a fixed value for an existing property or to add a completely new property
     :param excluded_default_properties: properties which shall be completely removed from serialisations, if they are set
-        to the given default value
+        to the given default value (properties whose values cannot be compared to the default value in a scalar manner,
+        e.g. numpy arrays, are never removed)
     :return: the state dictionary, which may be modified by the receiver
     """
     s = super(cls, obj)
@@ -307,7 +720,10 @@ def getstate(
         d = s.__getstate__()
     else:
         d = obj.__dict__
-    d = copy(d)
+    # NOTE: copying the state (at C level) and then applying the (typically few) changes for the given properties is
+    # considerably faster than building the resulting dictionary in a single pass over all properties in Python code.
+    # The copy is required even if no changes are to be applied, since the receiver may modify the returned dictionary.
+    d = d.copy() if type(d) is dict else copy(d)
     if transient_properties is not None:
         for p in transient_properties:
             if p in d:
@@ -321,6 +737,6 @@ def getstate(
             d[k] = v
     if excluded_default_properties is not None:
         for p, v in excluded_default_properties.items():
-            if p in d and d[p] == v:
+            if p in d and _is_equal_to_default(d[p], v):
                 del d[p]
     return d
@@ -1,13 +1,16 @@
+import colorsys
+import itertools
 import logging
+import math
 from typing import Sequence, Callable, TypeVar, Tuple, Optional, List, Any, Union, Dict
 
 import matplotlib.figure
 import matplotlib.ticker as plticker
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from matplotlib import pyplot as plt
 from matplotlib.colors import LinearSegmentedColormap
+# NOTE: seaborn is imported within the functions that use it, as importing it is comparatively slow
 
 from sensai.util.pandas import SeriesInterpolation
 
@@ -28,21 +31,28 @@ class Color:
         :param amount: amount to darken in [0,1], where 1 results in black and 0 leaves the color unchanged
         :return: the darkened color
         """
-        import colorsys
-        rgb = matplotlib.colors.to_rgb(self.rgba)
-        h, l, s = colorsys.rgb_to_hls(*rgb)
+        h, l, s = colorsys.rgb_to_hls(*self.rgba[:3])
         l *= amount
         rgb = colorsys.hls_to_rgb(h, l, s)
         return Color((*rgb, self.rgba[3]))
 
+    def darken_many(self, amounts: Sequence[float]) -> List["Color"]:
+        """
+        Darkens the color by several amounts (e.g. to create a palette of shades), converting the color to the HLS
+        representation only once
+
+        :param amounts: the amounts to darken by (see `darken`)
+        :return: the list of darkened colors
+        """
+        h, l, s = colorsys.rgb_to_hls(*self.rgba[:3])
+        return [Color((*colorsys.hls_to_rgb(h, l * amount, s), self.rgba[3])) for amount in amounts]
+
     def lighten(self, amount: float):
         """
         :param amount: amount to lighten in [0,1], where 1 results in white and 0 leaves the color unchanged
         :return: the lightened color
         """
-        import colorsys
-        rgb = matplotlib.colors.to_rgb(self.rgba)
-        h, l, s = colorsys.rgb_to_hls(*rgb)
+        h, l, s = colorsys.rgb_to_hls(*self.rgba[:3])
         l += (1-l) * amount
         rgb = colorsys.hls_to_rgb(h, l, s)
         return Color((*rgb, self.rgba[3]))
@@ -55,7 +65,12 @@ class Color:
         """
         if not (0 <= opacity <= 1):
             raise ValueError(f"Opacity must be between 0 and 1, got {opacity}")
-        return Color((*self.rgba[:3], opacity))
+        if opacity == self.rgba[3]:
+            return self
+        # the components are known to be valid, so the conversion in the constructor can be bypassed
+        color = Color.__new__(Color)
+        color.rgba = (*self.rgba[:3], float(opacity))
+        return color
 
     def to_hex(self, keep_alpha=True) -> str:
         return matplotlib.colors.to_hex(self.rgba, keep_alpha)
@@ -66,6 +81,8 @@ class LinearColorMap:
     Facilitates usage of linear segmented colour maps by combining a colour map (member `cmap`), which transforms normalised values in [0,1]
     into colours, with a normaliser that transforms the original values. The member `scalarMapper`
     """
+    _cmap_counter = itertools.count()  # for unique colour map names (ids of collected instances may be reused)
+
     def __init__(self, norm_min, norm_max, cmap_points: List[Tuple[float, Any]], cmap_points_normalised=False):
         """
         :param norm_min: the value that shall be mapped to 0 in the normalised representation (any smaller values are also clipped to 0)
@@ -77,16 +94,46 @@ class LinearColorMap:
         self.norm = matplotlib.colors.Normalize(vmin=norm_min, vmax=norm_max, clip=True)
         if not cmap_points_normalised:
             cmap_points = [(self.norm(v), c) for v, c in cmap_points]
-        self.cmap = LinearSegmentedColormap.from_list(f"cmap{id(self)}", cmap_points)
+        self.cmap = LinearSegmentedColormap.from_list(f"cmap{next(self._cmap_counter)}", cmap_points)
         self.scalarMapper = matplotlib.cm.ScalarMappable(norm=self.norm, cmap=self.cmap)
+        self._hex_lut: Optional[List[str]] = None  # hex representations of the colour map's (discrete) colours, created on demand
+
+    @staticmethod
+    def _to_hex_colors(rgba: np.ndarray) -> List[str]:
+        hex_str = (rgba * 255).astype(np.uint8).tobytes().hex()
+        return ["#" + hex_str[i:i + 8] for i in range(0, len(hex_str), 8)]
 
     def get_color(self, value):
-        rgba = self.scalarMapper.to_rgba(value)
-        return '#%02x%02x%02x%02x' % tuple(int(v * 255) for v in rgba)
+        vmin, vmax = self.norm.vmin, self.norm.vmax
+        x = (float(value) - vmin) / (vmax - vmin) if vmax != vmin else 0.0
+        if not math.isfinite(x):
+            r, g, b, a = self.scalarMapper.to_rgba(value)
+            return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}{int(a * 255):02x}"
+        # look up the colour directly (same as the colour map's own lookup for normalised values clipped to [0, 1])
+        if self._hex_lut is None:
+            self._hex_lut = self._to_hex_colors(self.cmap(np.arange(self.cmap.N)))
+        n = len(self._hex_lut)
+        return self._hex_lut[min(max(int(x * n), 0), n - 1)]
+
+    def get_colors(self, values: Union[Sequence[float], np.ndarray]) -> List[str]:
+        """
+        Maps several values to colours at once (which is much faster than calling `get_color` for each value)
+
+        :param values: the values to map
+        :return: the list of colours (hex strings including the alpha channel), as returned by `get_color` for each value
+        """
+        return self._to_hex_colors(self.scalarMapper.to_rgba(np.asarray(values, dtype=float).ravel()))
+
+
+PLOT_MATRIX_MAX_ANNOTATED_CELLS = 2500
+"""
+the default maximum number of cells of a matrix for which `plot_matrix` adds annotations (value labels) to the cells
+"""
 
 
 def plot_matrix(matrix: np.ndarray, title: str, xtick_labels: Sequence[str], ytick_labels: Sequence[str], xlabel: str,
-        ylabel: str, normalize=True, figsize: Tuple[int, int] = (9, 9), title_add: str = None) -> matplotlib.figure.Figure:
+        ylabel: str, normalize=True, figsize: Tuple[int, int] = (9, 9), title_add: str = None,
+        annotate: Union[bool, int] = True) -> matplotlib.figure.Figure:
     """
     :param matrix: matrix whose data to plot, where matrix[i, j] will be rendered at x=i, y=j
     :param title: the plot's title
@@ -97,15 +144,20 @@ def plot_matrix(matrix: np.ndarray, title: str, xtick_labels: Sequence[str], yti
     :param normalize: whether to normalise the matrix before plotting it (dividing each entry by the sum of all entries)
     :param figsize: an optional size of the figure to be created
     :param title_add: an optional second line to add to the title
+    :param annotate: whether to annotate the cells with their values; if True, annotate only if the matrix has at most
+        `PLOT_MATRIX_MAX_ANNOTATED_CELLS` cells (as the annotations of larger matrices are illegible anyway); if an integer is
+        given, annotate only if the matrix has at most the given number of cells
     :return: the figure object
     """
-    matrix = np.transpose(matrix)
+    # use a contiguous copy of the transposed matrix for unit-stride access when normalising, rendering and annotating
+    matrix = np.ascontiguousarray(np.transpose(matrix))
 
     if title_add is not None:
         title += f"\n {title_add} "
 
     if normalize:
-        matrix = matrix.astype('float') / matrix.sum()
+        # float32 suffices for display purposes and halves the memory of the normalised copy
+        matrix = np.divide(matrix, float(matrix.sum()), dtype=np.float32)
     fig, ax = plt.subplots(figsize=figsize)
     fig.canvas.manager.set_window_title(title.replace("\n", " "))
     # We want to show all ticks...
@@ -123,18 +175,25 @@ def plot_matrix(matrix: np.ndarray, title: str, xtick_labels: Sequence[str], yti
     plt.setp(ax.get_xticklabels(), rotation=45, ha="right",
         rotation_mode="anchor")
 
-    # Loop over data dimensions and create text annotations.
-    fmt = '.4f' if normalize else ('.2f' if matrix.dtype.kind == 'f' else 'd')
-    thresh = matrix.max() / 2.
-    for i in range(matrix.shape[0]):
-        for j in range(matrix.shape[1]):
-            ax.text(j, i, format(matrix[i, j], fmt),
-                ha="center", va="center",
-                color="white" if matrix[i, j] > thresh else "black")
+    if annotate is True:
+        annotate = PLOT_MATRIX_MAX_ANNOTATED_CELLS
+    if annotate is not False and matrix.size <= annotate:
+        _annotate_matrix_cells(ax, matrix, normalize)
     fig.tight_layout()
     return fig
 
 
+def _annotate_matrix_cells(ax: plt.Axes, matrix: np.ndarray, normalize: bool):
+    fmt = '.4f' if normalize else ('.2f' if matrix.dtype.kind == 'f' else 'd')
+    thresh = matrix.max() / 2.
+    labels = np.char.mod(f"%{fmt}", matrix).tolist()
+    colors = np.where(matrix > thresh, "white", "black").tolist()
+    text = ax.text
+    for i, (row_labels, row_colors) in enumerate(zip(labels, colors)):
+        for j, (label, color) in enumerate(zip(row_labels, row_colors)):
+            text(j, i, label, ha="center", va="center", color=color)
+
+
 TPlot = TypeVar("TPlot", bound="Plot")
 
 
@@ -248,24 +307,74 @@ class ScatterPlot(Plot):
             x_label = x.name
         if y_label is None and hasattr(y, "name"):
             y_label = y.name
+        # convert once (the values are used both for the scatter plot and the diagonal); no dtype is enforced, as scatter plots
+        # also support non-numeric values (e.g. dates)
+        x_values, y_values = np.asarray(x), np.asarray(y)
 
         def draw(ax):
             if x_label is not None:
                 plt.xlabel(x_label)
             if x_label is not None:
                 plt.ylabel(y_label)
-            value_range = [min(min(x), min(y)), max(max(x), max(y))]
-            plt.scatter(x, y, c=c, **kwargs)
+            plt.scatter(x_values, y_values, c=c, **kwargs)
             if add_diagonal:
+                value_range = [min(np.nanmin(x_values), np.nanmin(y_values)), max(np.nanmax(x_values), np.nanmax(y_values))]
                 plt.plot(value_range, value_range, '-', lw=1, label="_not in legend", color="green", zorder=1)
 
         super().__init__(draw)
 
 
-class HeatMapPlot(Plot):
-    DEFAULT_CMAP_FACTORY = lambda num_points: LinearSegmentedColormap.from_list("whiteToRed",
+def _histogram2d(x: np.ndarray, y: np.ndarray, x_range: Sequence[float], y_range: Sequence[float], bins) -> np.ndarray:
+    """
+    Computes the same histogram as `np.histogram2d` (with `density=False`). For an integer number of (uniform) bins, bin indices
+    are computed arithmetically (correcting for floating point rounding errors by comparing with the actual bin edges, as
+    in `np.histogram`) and counted via a single `np.bincount` (rather than locating each value via binary search on the
+    bin edges), which is considerably faster for large numbers of points.
+
+    :param x: the x values
+    :param y: the y values
+    :param x_range: the range [min, max] of x values to consider
+    :param y_range: the range [min, max] of y values to consider
+    :param bins: the number of bins in each dimension or any other bin specification supported by `np.histogram2d`
+    :return: the histogram, where the first axis corresponds to x and the second to y
+    """
+    if not isinstance(bins, (int, np.integer)):
+        return np.histogram2d(x, y, range=[x_range, y_range], bins=bins, density=False)[0]
+
+    def bounds(value_range):
+        lo, hi = float(value_range[0]), float(value_range[1])
+        if lo == hi:  # same as np.histogram2d
+            lo, hi = lo - 0.5, hi + 0.5
+        return lo, hi
+
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    x_lo, x_hi = bounds(x_range)
+    y_lo, y_hi = bounds(y_range)
+    in_range = (x >= x_lo) & (x <= x_hi) & (y >= y_lo) & (y <= y_hi)
+    x, y = x[in_range], y[in_range]
+
+    def bin_indices(values, lo, hi):
+        indices = np.minimum(((values - lo) * (bins / (hi - lo))).astype(np.intp), bins - 1)
+        # the computed index may be off by one for values (close to) bin edges
+        edges = np.linspace(lo, hi, bins + 1)
+        indices[values < edges[indices]] -= 1
+        indices[(values >= edges[indices + 1]) & (indices != bins - 1)] += 1
+        return indices
+
+    counts = np.bincount(bin_indices(x, x_lo, x_hi) * bins + bin_indices(y, y_lo, y_hi), minlength=bins * bins)
+    return counts.reshape(bins, bins).astype(float)
+
+
+def _create_default_heat_map_cmap(num_points: int) -> LinearSegmentedColormap:
+    # NOTE: The resolution (number of colours) must not be reduced, because it ensures that even a single point is
+    # rendered in a colour that is distinguishable from white.
+    return LinearSegmentedColormap.from_list("whiteToRed",
         ((0, (1, 1, 1)), (1 / num_points, (1, 0.96, 0.96)), (1, (0.7, 0, 0))), num_points)
 
+
+class HeatMapPlot(Plot):
+    DEFAULT_CMAP_FACTORY = _create_default_heat_map_cmap
+
     def __init__(self, x, y, x_label=None, y_label=None, bins=60, cmap=None, common_range=True, diagonal=False,
             diagonal_color="green", **kwargs):
         """
@@ -286,29 +395,68 @@ class HeatMapPlot(Plot):
             x_label = x.name
         if y_label is None and hasattr(y, "name"):
             y_label = y.name
+        # convert once to contiguous float arrays (as required for the computation of ranges and the histogram)
+        x_values, y_values = np.ascontiguousarray(x, dtype=np.float64), np.ascontiguousarray(y, dtype=np.float64)
 
         def draw(ax):
             nonlocal cmap
-            x_range = [min(x), max(x)]
-            y_range = [min(y), max(y)]
+            x_range = [np.nanmin(x_values), np.nanmax(x_values)]
+            y_range = [np.nanmin(y_values), np.nanmax(y_values)]
             rng = [min(x_range[0], y_range[0]), max(x_range[1], y_range[1])]
             if common_range:
                 x_range = y_range = rng
             if diagonal:
                 plt.plot(rng, rng, '-', lw=0.75, label="_not in legend", color=diagonal_color, zorder=2)
-            heatmap, _, _ = np.histogram2d(x, y, range=[x_range, y_range], bins=bins, density=False)
+            # compute the histogram with y as the first axis, such that it can be passed on to imshow without transposition
+            heatmap = _histogram2d(y_values, x_values, y_range, x_range, bins)
             extent = [x_range[0], x_range[1], y_range[0], y_range[1]]
             if cmap is None:
-                cmap = HeatMapPlot.DEFAULT_CMAP_FACTORY(len(x))
+                cmap = HeatMapPlot.DEFAULT_CMAP_FACTORY(len(x_values))
             if x_label is not None:
                 plt.xlabel(x_label)
             if y_label is not None:
                 plt.ylabel(y_label)
-            plt.imshow(heatmap.T, extent=extent, origin='lower', interpolation="none", cmap=cmap, zorder=1, aspect="auto", **kwargs)
+            plt.imshow(heatmap, extent=extent, origin='lower', interpolation="none", cmap=cmap, zorder=1, aspect="auto", **kwargs)
 
         super().__init__(draw)
 
 
+def _plot_ecdf(values, stat: str = "proportion", complementary: bool = False, ax: Optional[plt.Axes] = None, **kwargs):
+    """
+    Plots the empirical cumulative distribution function of the given values (like `sns.ecdfplot` for unweighted values),
+    drawing the step function directly from the sorted values, which is considerably faster for large numbers of values
+
+    :param values: the values
+    :param stat: the statistic to plot ("proportion", "percent" or "count")
+    :param complementary: whether to plot the complementary cdf (1 - cdf)
+    :param ax: the axes to draw to; if None, use the current axes
+    :param kwargs: arguments to pass on to `Axes.plot`
+    """
+    if stat == "proportion":
+        top = 1.0
+    elif stat == "percent":
+        top = 100.0
+    elif stat == "count":
+        top = None
+    else:
+        raise ValueError(f"Unsupported statistic for cdf: {stat}")
+    if ax is None:
+        ax = plt.gca()
+    values = np.asarray(values, dtype=float)
+    sorted_values = np.sort(values[~np.isnan(values)])
+    n = len(sorted_values)
+    y = np.arange(n + 1, dtype=float)
+    if top is None:
+        top = float(n)
+    elif n > 0:
+        y *= top / n
+    if complementary:
+        y = top - y
+    # prepend -inf such that the step function extends to the left boundary of the plot (as in seaborn)
+    line, = ax.plot(np.concatenate(([-np.inf], sorted_values)), y, drawstyle="steps-post", **kwargs)
+    line.sticky_edges.y[:] = [0, top]
+
+
 class HistogramPlot(Plot):
     def __init__(self, values, bins="auto", kde=False, cdf=False, cdf_complementary=False, cdf_secondary_axis=True,
             binwidth=None, stat="probability", xlabel=None,
@@ -327,6 +475,7 @@ class HistogramPlot(Plot):
         """
 
         def draw(ax):
+            import seaborn as sns
             nonlocal cdf_secondary_axis
             sns.histplot(values, bins=bins, kde=kde, binwidth=binwidth, stat=stat, **kwargs)
             plt.ylabel(stat)
@@ -349,7 +498,7 @@ class HistogramPlot(Plot):
                         cdf_ax.yaxis.set_major_locator(plticker.MultipleLocator(base=y_tick))
                 if cdf_complementary or ecdf_stat in ("count", "proportion", "probability"):
                     ecdf_stat = "proportion" if stat == "probability" else stat  # same semantics but "probability" not understood by ecdfplot
-                    sns.ecdfplot(values, stat=ecdf_stat, complementary=cdf_complementary, color="orange", ax=cdf_ax)
+                    _plot_ecdf(values, stat=ecdf_stat, complementary=cdf_complementary, color="orange", ax=cdf_ax)
                 else:
                     sns.histplot(values, bins=100, stat=stat, element="poly", fill=False, cumulative=True, color="orange", ax=cdf_ax)
                 if cdf_ax is not None:
@@ -391,18 +540,26 @@ class AverageSeriesLinePlot(Plot):
         x_name = series_list[0].index.name or "x"
         y_name = series_list[0].name or "y"
 
-        # build data frame with all series, interpolating each sub-collection
-        dfs = []
+        # build data frame with all series, interpolating each sub-collection (assembling each column from arrays);
+        # since the interpolated series of a sub-collection share the same index, their values can be stacked
+        y_arrays, x_arrays, series_id_arrays, name_arrays = [], [], [], []
+        num_series_total = 0
         for name, series_list in series_dict.items():
             interpolated_series_list = interpolation.interpolate_all_with_combined_index(series_list)
-            for series in interpolated_series_list:
-                df = pd.DataFrame({y_name: series, x_name: series.index})
-                df["series_id"] = id(series)
-                df[collection_name] = name
-                dfs.append(df)
-        full_df = pd.concat(dfs, axis=0).reset_index(drop=True)
+            if len(interpolated_series_list) == 0:
+                continue
+            values = np.stack([series.to_numpy() for series in interpolated_series_list])
+            num_series, num_points = values.shape
+            y_arrays.append(values.ravel())
+            x_arrays.append(np.tile(interpolated_series_list[0].index.to_numpy(), num_series))
+            series_id_arrays.append(np.repeat(np.arange(num_series_total, num_series_total + num_series), num_points))
+            name_arrays.append(np.full(values.size, name, dtype=object))
+            num_series_total += num_series
+        full_df = pd.DataFrame({y_name: np.concatenate(y_arrays), x_name: np.concatenate(x_arrays),
+            "series_id": np.concatenate(series_id_arrays), collection_name: np.concatenate(name_arrays)})
 
         def draw(ax):
+            import seaborn as sns
             sns.lineplot(
                 data=full_df,
                 x=x_name,
@@ -445,9 +602,13 @@ class MetricComparisonBarPlot(Plot):
         """
 
         def draw(ax: Optional[plt.Axes]):
-            index_name = df.index.name or "index"
-            df_melted = df.reset_index().melt(id_vars=index_name, var_name=metric_label, value_name=value_label)
-            df_melted.rename(columns={index_name: entity_label}, inplace=True)
+            import seaborn as sns
+            # melt the data frame (column by column, as in df.melt) via numpy
+            n_rows, n_cols = df.shape
+            df_melted = pd.DataFrame({
+                entity_label: np.tile(df.index.to_numpy(), n_cols),
+                metric_label: np.repeat(df.columns.to_numpy(), n_rows),
+                value_label: df.to_numpy().ravel(order="F")})
             df_melted['Metric'] = pd.Categorical(df_melted[metric_label], categories=df.columns, ordered=True)
 
             sns.barplot(data=df_melted,
@@ -0,0 +1,236 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from sensai.evaluation.evaluator import MetricsDictProviderFromFunction, MetricsDictProvider
+from sensai.hyperopt import ParametersMetricsCollection, SuccessiveHalvingSearch, iter_param_combinations, OptionsOneOf, \
+    OptionsAllOf, OptionsOneOrNoneOf, ParameterCombinationEquivalenceClassValueCache, GridSearch, MedianPruner, \
+    ParameterCombinationSkipDecider, OptionsSubsets
+from sensai.tracking import TrackedExperiment
+from sensai.util.cache import SqlitePersistentKeyValueCache
+
+
+def test_parameters_metrics_collection_contains(tmp_path):
+    csv_path = str(tmp_path / "results.csv")
+    collection = ParametersMetricsCollection(csv_path=csv_path)
+    collection.add_values({"metric": 0.5, "a": 1, "b": "x"})
+    collection.add_values({"metric": 0.7, "a": 2.5, "b": None})
+    assert collection.contains({"a": 1, "b": "x"})
+    assert not collection.contains({"a": 1, "b": "y"})
+    assert collection.contains({"a": 2.5})
+
+    # values read back from the CSV file are matched via their canonical representations
+    collection = ParametersMetricsCollection(csv_path=csv_path, incremental=True)
+    assert collection.contains({"a": 1, "b": "x"})
+    assert collection.contains({"a": 1.0})
+    assert not collection.contains({"a": 3, "b": "x"})
+    collection.add_values({"metric": 0.2, "a": 3, "b": "x"})
+    assert collection.contains({"a": 3, "b": "x"})
+
+
+def test_parameters_metrics_collection_contains_mixed_types(tmp_path):
+    csv_path = str(tmp_path / "results.csv")
+    collection = ParametersMetricsCollection(csv_path=csv_path)
+    for metric, max_features in enumerate(["sqrt", 0.5, 1.0]):
+        collection.add_values({"metric": metric, "max_features": max_features})
+
+    # the mixed-type column is read back as strings, which match the original values via their string representations
+    collection = ParametersMetricsCollection(csv_path=csv_path, incremental=True)
+    for max_features in ["sqrt", 0.5, 1.0]:
+        assert collection.contains({"max_features": max_features})
+    assert not collection.contains({"max_features": 1})
+
+
+def test_parameters_metrics_collection_contains_tuples(tmp_path):
+    csv_path = str(tmp_path / "results.csv")
+    collection = ParametersMetricsCollection(csv_path=csv_path)
+    collection.add_values({"metric": 0.5, "a": (1.0, 2.0)})
+    # equal tuples with different string representations match
+    for _ in range(2):
+        assert collection.contains({"a": (1, 2)})
+        assert collection.contains({"a": (1.0, 2.0)})
+
+    # the tuple is read back from the CSV file as a string, which matches only the tuple with the same string representation
+    collection = ParametersMetricsCollection(csv_path=csv_path, incremental=True)
+    for _ in range(2):
+        assert collection.contains({"a": (1.0, 2.0)})
+        assert not collection.contains({"a": (1, 2)})
+
+
+class _BudgetModel:
+    def __init__(self, quality: float, budget: int):
+        self.quality = quality
+        self.budget = budget
+
+
+def test_successive_halving_search():
+    evaluated = []
+
+    def compute_metrics(model):
+        evaluated.append((model.quality, model.budget))
+        return {"score": model.quality * model.budget}
+
+    search = SuccessiveHalvingSearch(_BudgetModel, {"quality": [1, 2, 3, 4, 5, 6, 7, 8, 9]}, "budget", min_resource=1, max_resource=9,
+        reduction_factor=3)
+    result = search.run(MetricsDictProviderFromFunction(compute_metrics), sort_column_name="score", ascending=False)
+    assert len(evaluated) == 9 + 3 + 1
+    assert sorted(q for q, b in evaluated if b == 3) == [7, 8, 9]
+    best = result.get_best_params()
+    assert best.params == {"quality": 9, "budget": 9}
+
+    evaluated.clear()
+    search = SuccessiveHalvingSearch(_BudgetModel, {"quality": [1, 2, 3, 4, 5, 6, 7, 8, 9]}, "budget", min_resource=1, max_resource=9,
+        reduction_factor=3, hyperband=True)
+    search.run(MetricsDictProviderFromFunction(compute_metrics), sort_column_name="score", ascending=False)
+    assert all(b in (1, 3, 9) for q, b in evaluated)
+
+
+def test_parameters_metrics_collection_csv(tmp_path):
+    csv_path = str(tmp_path / "results.csv")
+    collection = ParametersMetricsCollection(csv_path=csv_path, sort_column_name="metric", ascending=False)
+    collection.add_values({"a": 1, "metric": 0.5})
+    collection.add_values({"a": 2, "metric": 0.7})
+    collection.add_values({"a": 3, "metric": 0.6, "b": "x"})
+    df = collection.get_data_frame()
+    assert list(df.columns) == ["metric", "a", "b"]
+    assert list(df["a"]) == [2, 3, 1]
+
+    collection = ParametersMetricsCollection(csv_path=csv_path, sort_column_name="metric", ascending=False, incremental=True)
+    assert len(collection) == 3
+    collection.add_values({"a": 4, "metric": 0.9, "b": "y"})
+    df = pd.read_csv(csv_path)
+    assert len(df) == 4
+    assert collection.get_data_frame()["a"].iloc[0] == 4
+
+
+def test_parameters_metrics_collection_csv_engine_fallback(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / "results.csv")
+    collection = ParametersMetricsCollection(csv_path=csv_path)
+    collection.add_values({"a": 1, "metric": 0.5})
+    collection.close()
+
+    # simulate a pandas version which does not support the pyarrow engine
+    read_csv = pd.read_csv
+
+    def read_csv_without_pyarrow_engine(*args, engine=None, **kwargs):
+        if engine == "pyarrow":
+            raise ValueError("unknown engine")
+        return read_csv(*args, engine=engine, **kwargs)
+
+    monkeypatch.setattr(ParametersMetricsCollection, "_is_pyarrow_csv_engine_available", staticmethod(lambda: True))
+    monkeypatch.setattr(pd, "read_csv", read_csv_without_pyarrow_engine)
+    collection = ParametersMetricsCollection(csv_path=csv_path, incremental=True)
+    assert len(collection) == 1
+    assert collection.contains({"a": 1})
+
+
+def test_iter_param_combinations():
+    combinations = list(iter_param_combinations({"a": [1, 2], "b": ["x", "y", "z"]}))
+    assert len(combinations) == 6
+    assert combinations[0] == {"a": 1, "b": "x"}
+    assert combinations[-1] == {"a": 2, "b": "z"}
+    assert list(iter_param_combinations({})) == [{}]
+
+
+def test_options_product():
+    gen = OptionsOneOf(["a", "b"]).times(OptionsAllOf(["c", "d"])).times(OptionsOneOrNoneOf(["e"]))
+    combinations = [[o.key for o in options] for options in gen.iter_options()]
+    assert combinations == [["a", "c", "d"], ["a", "c", "d", "e"], ["b", "c", "d"], ["b", "c", "d", "e"]]
+
+
+def test_options_subsets():
+    gen = OptionsSubsets(["a", "b", "c"])
+    subsets = [[o.key for o in options] for options in gen.iter_options()]
+    assert subsets == [[], ["a"], ["b"], ["c"], ["a", "b"], ["a", "c"], ["b", "c"], ["a", "b", "c"]]
+    masks_and_subsets = [(mask, [o.key for o in options]) for mask, options in gen.iter_options_with_masks()]
+    assert masks_and_subsets == list(zip([0, 1, 2, 4, 3, 5, 6, 7], subsets))
+
+
+def test_persistent_equivalence_class_value_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    persistent_cache = SqlitePersistentKeyValueCache(path)
+    cache = ParameterCombinationEquivalenceClassValueCache(persistent_cache=persistent_cache)
+    cache.set({"a": 1, "b": 2}, {"metric": 0.5})
+    persistent_cache.finalise()
+
+    cache = ParameterCombinationEquivalenceClassValueCache(persistent_cache=SqlitePersistentKeyValueCache(path))
+    assert cache.get({"b": 2, "a": 1}) == {"metric": 0.5}
+    assert cache.get({"a": 2, "b": 2}) is None
+
+
+class _StepwiseMetricsProvider(MetricsDictProvider):
+    def _compute_metrics(self, model, **kwargs):
+        for step in range(1, 4):
+            self._report_intermediate_metrics(step, lambda: {"score": model.quality})
+        return {"score": model.quality}
+
+
+def test_grid_search_median_pruner():
+    pruner = MedianPruner("score", higher_is_better=True, min_trials=2)
+    search = GridSearch(lambda quality: _BudgetModel(quality, 1), {"quality": [5, 4, 6, 1, 7]}, pruner=pruner)
+    result = search.run(_StepwiseMetricsProvider(), sort_column_name="score", ascending=False)
+    assert sorted(result.df["quality"]) == [4, 5, 6, 7]
+
+
+def test_grid_search_with_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        search = GridSearch(lambda quality: _BudgetModel(quality, 2), {"quality": [1, 2, 3]}, executor=executor)
+        result = search.run(MetricsDictProviderFromFunction(lambda model: {"score": model.quality * model.budget}),
+            sort_column_name="score", ascending=False)
+    assert result.get_best_params().params == {"quality": 3}
+    assert len(result.df) == 3
+
+
+class _ListTrackedExperiment(TrackedExperiment):
+    def __init__(self):
+        super().__init__()
+        self.values_dicts = []
+
+    def _track_values(self, values_dict):
+        self.values_dicts.append(values_dict)
+
+    def _create_tracking_context(self, name, description):
+        raise NotImplementedError()
+
+
+def test_grid_search_tracking():
+    search = GridSearch(lambda quality: _BudgetModel(quality, 1), {"quality": [1, 2, 3]})
+    experiment = _ListTrackedExperiment()
+    search.set_tracked_experiment(experiment)
+    search.run(MetricsDictProviderFromFunction(lambda model: {"score": model.quality}), sort_column_name="score")
+    assert sorted(d["quality"] for d in experiment.values_dicts) == [1, 2, 3]
+
+
+def _compute_budget_model_metrics(model: _BudgetModel):
+    return {"score": model.quality * model.budget}
+
+
+def test_grid_search_multiprocessing():
+    with GridSearch(_BudgetModel, {"quality": [1, 2, 3], "budget": [1, 2]}, num_processes=2) as search:
+        for _ in range(2):
+            result = search.run(MetricsDictProviderFromFunction(_compute_budget_model_metrics), sort_column_name="score",
+                ascending=False)
+            assert result.get_best_params().params == {"quality": 3, "budget": 2}
+            assert len(result.df) == 6
+
+
+class _OddQualitySkipDecider(ParameterCombinationSkipDecider):
+    def __init__(self):
+        self.lock = threading.Lock()  # not picklable
+        self.told_qualities = []
+
+    def tell(self, params, metrics):
+        self.told_qualities.append(params["quality"])
+
+    def is_skipped(self, params):
+        return params["quality"] % 2 == 1
+
+
+def test_grid_search_multiprocessing_skip_decider():
+    skip_decider = _OddQualitySkipDecider()
+    with GridSearch(_BudgetModel, {"quality": [1, 2, 3, 4], "budget": [1]}, num_processes=2,
+            parameter_combination_skip_decider=skip_decider) as search:
+        result = search.run(MetricsDictProviderFromFunction(_compute_budget_model_metrics), sort_column_name="score")
+    assert sorted(result.df["quality"]) == [2, 4]
+    assert sorted(skip_decider.told_qualities) == [2, 4]
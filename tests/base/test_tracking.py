@@ -1,3 +1,6 @@
+import pytest
+
+from sensai.tracking.tracking_base import TrackedExperiment, BackgroundValuesTracker
 from sensai.util import mark_used
 
 
@@ -5,3 +8,34 @@ def test_tracking():
     import sensai.tracking
     mark_used(sensai.tracking)
     assert True
+
+
+class _FailingTrackedExperiment(TrackedExperiment):
+    def __init__(self):
+        super().__init__()
+        self.values_dicts = []
+
+    def _track_values(self, values_dict):
+        if values_dict["value"] == 2:
+            raise ValueError("tracking failed")
+        self.values_dicts.append(values_dict)
+
+    def _create_tracking_context(self, name, description):
+        raise NotImplementedError()
+
+
+def test_background_values_tracker_raises_tracking_exceptions():
+    experiment = _FailingTrackedExperiment()
+    tracker = BackgroundValuesTracker(experiment)
+    for value in range(4):
+        tracker.track_values({"value": value})
+    with pytest.raises(ValueError):
+        tracker.flush()
+    tracker.close()  # the exception was already raised
+    assert [d["value"] for d in experiment.values_dicts] == [0, 1, 3]
+
+
+def test_background_values_tracker_close_without_raising():
+    tracker = BackgroundValuesTracker(_FailingTrackedExperiment())
+    tracker.track_values({"value": 2})
+    tracker.close(raise_exceptions=False)  # the exception is only logged
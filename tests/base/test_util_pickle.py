@@ -0,0 +1,113 @@
+import threading
+
+import numpy as np
+import pytest
+
+from sensai.util.pickle import dump_pickle, dump_pickle_async, load_pickle, PickleFailureDebugger, SharedMemoDumper, \
+    load_shared_memo_pickles, getstate
+
+
+@pytest.mark.parametrize("filename", ["obj.pickle", "obj.pickle.bz2", "obj.pickle.zst", "obj.pickle.lz4"])
+@pytest.mark.parametrize("backend, protocol", [("pickle", None), ("pickle", 0), ("pickle", 2), ("joblib", None)])
+def test_dump_load_pickle(tmp_path, filename, backend, protocol):
+    if filename.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    if filename.endswith(".lz4"):
+        pytest.importorskip("lz4")
+    if backend == "joblib":
+        pytest.importorskip("joblib")
+    obj = {"a": list(range(1000)), "b": "text", "c": np.arange(100)}
+    path = tmp_path / filename
+    dump_kwargs = {} if protocol is None else dict(protocol=protocol)
+    dump_pickle(obj, path, backend=backend, **dump_kwargs)
+    loaded_obj = load_pickle(path, backend=backend)
+    assert loaded_obj["a"] == obj["a"] and loaded_obj["b"] == obj["b"]
+    assert np.array_equal(loaded_obj["c"], obj["c"])
+    if filename.endswith(".bz2"):
+        with open(path, "rb") as f:
+            assert f.read(3) == b"BZh"
+
+
+def test_dump_load_pickle_out_of_band(tmp_path):
+    obj = {"x": np.arange(1000, dtype=np.float64), "y": np.ones((10, 3), dtype=np.int32), "z": np.zeros(0), "name": "obj"}
+    path = tmp_path / "obj.pickle"
+    dump_pickle(obj, path, out_of_band=True)
+    loaded = load_pickle(path, out_of_band=True)
+    assert loaded["name"] == "obj"
+    for key in ("x", "y", "z"):
+        assert np.array_equal(loaded[key], obj[key])
+    loaded["x"][0] = 42  # buffers are writable
+    assert load_pickle(path, out_of_band=True)["x"][0] == 0
+
+    # a negative protocol selects the highest protocol
+    dump_pickle(obj, path, out_of_band=True, protocol=-1)
+    assert np.array_equal(load_pickle(path, out_of_band=True)["x"], obj["x"])
+    with pytest.raises(ValueError):
+        dump_pickle(obj, path, out_of_band=True, protocol=4)
+
+
+class _UnpicklableContainer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = [1, 2]
+        self.child = {"fn": lambda: 1}
+        self.same_child = self.child
+        self.self_ref = self
+
+
+def test_pickle_failure_debugger():
+    assert PickleFailureDebugger.debug_failure(_UnpicklableContainer()) == \
+        ["_UnpicklableContainer.lock[lock]", "_UnpicklableContainer.child[dict].fn[function]"]
+    assert PickleFailureDebugger.debug_failure({"a": [1, 2]}) == []
+
+
+def test_shared_memo_dumper(tmp_path):
+    shared = list(range(10000))
+    objs = [{"trial": i, "shared": shared} for i in range(3)]
+    path = tmp_path / "objs.pickle"
+    with SharedMemoDumper(path) as dumper:
+        for obj in objs:
+            dumper.dump(obj)
+    loaded = list(load_shared_memo_pickles(path))
+    assert loaded == objs
+    assert loaded[0]["shared"] is loaded[2]["shared"]
+    dump_pickle(objs[0], tmp_path / "obj.pickle")
+    assert path.stat().st_size < 1.5 * (tmp_path / "obj.pickle").stat().st_size
+
+
+def test_dump_pickle_async(tmp_path):
+    obj = {"values": list(range(100))}
+    future = dump_pickle_async(obj, tmp_path / "sub" / "obj.pickle.bz2")
+    obj["values"].clear()  # the object is serialised before the function returns
+    future.result()
+    assert load_pickle(tmp_path / "sub" / "obj.pickle.bz2") == {"values": list(range(100))}
+
+
+def test_dump_load_pickle_zstd_dict(tmp_path):
+    pytest.importorskip("zstandard")
+    from sensai.util.pickle import train_pickle_zstd_dict
+    sample_paths = []
+    for i in range(100):
+        sample_paths.append(tmp_path / f"sample{i}.pickle")
+        dump_pickle({"trial": i, "params": {"learning_rate": 0.1 * i, "layers": [i, 2 * i]}}, sample_paths[-1])
+    dict_path = tmp_path / "pickles.dict"
+    train_pickle_zstd_dict(sample_paths, dict_path, dict_size=4096)
+    obj = {"trial": 200, "params": {"learning_rate": 20.0, "layers": [200, 400]}}
+    dump_pickle(obj, tmp_path / "obj.pickle.zst", zstd_dict_path=dict_path)
+    assert load_pickle(tmp_path / "obj.pickle.zst", zstd_dict_path=dict_path) == obj
+
+
+class _StateWithDefaults:
+    def __init__(self, a, b, c):
+        self.a = a
+        self.b = b
+        self.c = c
+
+    def __getstate__(self):
+        return getstate(_StateWithDefaults, self, excluded_default_properties={"a": 0, "b": None, "c": 1.0})
+
+
+def test_getstate_excluded_default_properties():
+    assert _StateWithDefaults(0, None, np.float64(1.0)).__getstate__() == {}
+    state = _StateWithDefaults(np.zeros(3), 1, np.ones(1)).__getstate__()
+    assert sorted(state.keys()) == ["a", "b", "c"]
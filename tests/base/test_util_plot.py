@@ -0,0 +1,25 @@
+import numpy as np
+
+from sensai.util.plot import HeatMapPlot, ScatterPlot, _histogram2d
+
+
+def test_plots_ignore_nan_values():
+    x = np.array([1.0, np.nan, 2.0, 3.0])
+    y = np.array([1.5, 2.5, np.nan, 3.5])
+
+    plot = ScatterPlot(x, y, add_diagonal=True)
+    assert list(plot.ax.lines[0].get_xdata()) == [1.0, 3.5]
+
+    plot = HeatMapPlot(x, y, bins=5)
+    assert plot.ax.images[0].get_extent() == [1.0, 3.5, 1.0, 3.5]
+    assert plot.ax.images[0].get_array().sum() == 2
+
+
+def test_histogram2d():
+    rng = np.random.default_rng(42)
+    for bins in (1, 7, 10, 60):
+        # rounded values, many of which lie exactly on bin edges
+        x, y = np.round(rng.uniform(-3, 7, 500), 1), np.round(rng.normal(0, 2, 500), 1)
+        for x_range, y_range in [([x.min(), x.max()], [y.min(), y.max()]), ([-2, 5], [-1, 1]), ([1, 1], [0, 2])]:
+            expected = np.histogram2d(x, y, range=[x_range, y_range], bins=bins)[0]
+            assert np.array_equal(_histogram2d(x, y, x_range, y_range, bins), expected)